@@ -21,12 +21,23 @@ import time
 import requests
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import math
 from pathlib import Path
 
+# Compilation JIT du calcul de consommation (optionnelle, threads NumPy sinon)
+try:
+    from numba import config as numba_config, get_num_threads, njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configuration des chemins
 PROJECT_ROOT = Path(__file__).parent.absolute()
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -45,6 +56,9 @@ class AppConfig:
     HOST = os.environ.get('FLASK_HOST', '127.0.0.1')
     PORT = int(os.environ.get('FLASK_PORT', 5000))
     
+    # Threads de génération (les bâtiments sont répartis entre les threads)
+    GENERATION_WORKERS = int(os.environ.get('GENERATION_WORKERS', os.cpu_count() or 1))
+    
     # Dossiers de l'application
     PROJECT_ROOT = PROJECT_ROOT
     EXPORTS_DIR = PROJECT_ROOT / 'exports'
@@ -746,21 +760,346 @@ class CompleteBuildingLoader:
 # GÉNÉRATEUR DE DONNÉES ÉLECTRIQUES
 # ==============================================================================
 
+# Règles Malaysia de chaque facteur (version scalaire), évaluées une seule fois à
+# l'import pour remplir les tables de facteurs ci-dessous
+
+def _hourly_factor_rule(hour: int, building_type: str) -> float:
+    """
+    Facteurs horaires selon le climat tropical Malaysia
+
+    Patterns officiels:
+    - 6h-8h : Pic matinal (avant la chaleur) 
+    - 11h-16h : Maximum de climatisation (heures les plus chaudes)
+    - 17h-21h : Activité élevée (après-midi/soirée)
+    - 22h-5h : Consommation nocturne réduite
+    """
+    # Facteurs nocturnes par type
+    night_factors = {
+        'residential': 0.3, 'commercial': 0.2, 'industrial': 0.7,
+        'office': 0.1, 'hospital': 0.8, 'school': 0.05,
+        'hotel': 0.6, 'public': 0.1, 'religious': 0.05
+    }
+
+    night_factor = night_factors.get(building_type, 0.3)
+
+    if building_type == 'residential':
+        if 6 <= hour <= 8:  # Pic matinal
+            return 1.4
+        elif 11 <= hour <= 16:  # Maximum climatisation  
+            return 2.0
+        elif 17 <= hour <= 21:  # Activité élevée
+            return 1.6
+        elif 22 <= hour <= 23 or 0 <= hour <= 5:  # Nuit
+            return night_factor
+        else:
+            return 1.0
+
+    elif building_type == 'commercial':
+        if 9 <= hour <= 21:  # Ouvert
+            if 11 <= hour <= 16:  # Pic climatisation
+                return 2.5
+            else:
+                return 1.8
+        else:  # Fermé
+            return night_factor
+
+    elif building_type == 'office':
+        if 8 <= hour <= 18:  # Heures bureau
+            if 11 <= hour <= 16:  # Pic climatisation
+                return 3.0
+            else:
+                return 2.0
+        else:  # Fermé
+            return night_factor
+
+    elif building_type == 'school':
+        if 7 <= hour <= 15:  # Heures scolaires
+            if 11 <= hour <= 14:  # Pic climatisation
+                return 5.0
+            else:
+                return 3.0
+        else:  # Fermé
+            return night_factor
+
+    elif building_type == 'hospital':
+        if 11 <= hour <= 16:  # Pic climatisation
+            return 1.8
+        elif 6 <= hour <= 22:  # Activité diurne
+            return 1.4
+        else:  # Nuit
+            return night_factor
+
+    elif building_type == 'industrial':
+        if 11 <= hour <= 16:  # Pic climatisation
+            return 2.0
+        elif 6 <= hour <= 22:  # Production
+            return 1.5
+        else:  # Nuit
+            return night_factor
+
+    return 1.0
+
+
+def _daily_factor_rule(weekday: int, building_type: str) -> float:
+    """
+    Facteurs hebdomadaires Malaysia:
+
+    - Vendredi après-midi : Réduction d'activité (prière du vendredi)
+    - Weekend : Plus de consommation résidentielle
+    - Jours ouvrables : Pics dans les bureaux/commerces
+    """
+    # 0=Lundi, 4=Vendredi, 5=Samedi, 6=Dimanche
+    is_weekend = weekday >= 5
+
+    if building_type == 'residential':
+        return 1.2 if is_weekend else 1.0
+
+    elif building_type in ['office', 'commercial']:
+        if is_weekend:
+            return 0.4  # Fermé week-end
+        else:
+            return 1.0
+
+    elif building_type == 'school':
+        return 0.05 if is_weekend else 1.0  # École fermée
+
+    elif building_type in ['hospital', 'hotel']:
+        return 1.0  # Pas d'impact majeur
+
+    elif building_type == 'industrial':
+        return 0.7 if is_weekend else 1.0  # Production réduite
+
+    else:
+        return 1.0
+
+
+def _seasonal_factor_rule(month: int) -> float:
+    """
+    Facteurs saisonniers Malaysia selon le document officiel:
+
+    - Nov-Fév: Mousson NE (0.9-1.1×) - Moins de climatisation
+    - Mar-Avr: Transition (1.2-1.5×) - Période chaude + Ramadan  
+    - Mai-Août: Saison sèche (1.3-1.7×) - Maximum de climatisation
+    - Sep-Oct: Variable (1.0-1.3×) - Climat changeant
+    """
+    seasonal_factors = {
+        # Mousson NE - Moins de climatisation
+        11: 0.95, 12: 0.9, 1: 0.9, 2: 1.0,
+
+        # Transition - Période chaude + Ramadan
+        3: 1.3, 4: 1.4,
+
+        # Saison sèche - Maximum de climatisation
+        5: 1.5, 6: 1.6, 7: 1.7, 8: 1.6,
+
+        # Variable - Climat changeant  
+        9: 1.2, 10: 1.1
+    }
+
+    return seasonal_factors.get(month, 1.0)
+
+
+def _ramadan_factor_rule(month: int, hour: int, building_type: str) -> float:
+    """
+    Facteurs Ramadan (Mar-Avr approximatif):
+
+    - 4h-17h : Consommation réduite de 40% (jeûne)
+    - 18h-23h : Consommation augmentée de 40% (Iftar, activités nocturnes)
+    """
+    # Ramadan approximatif en Mars-Avril
+    if month not in [3, 4]:
+        return 1.0
+
+    if building_type in ['residential', 'commercial']:
+        if 4 <= hour <= 17:  # Période de jeûne
+            return 0.6  # Réduction de 40%
+        elif 18 <= hour <= 23:  # Iftar et activités nocturnes
+            return 1.4  # Augmentation de 40%
+        else:
+            return 1.0
+    else:
+        return 1.0  # Hôpitaux, industriel moins affectés
+
+
+# codes des types de bâtiments connus, les types inconnus prennent le dernier code
+_TYPE_CODES = {
+    building_type: code for code, building_type in enumerate([
+        'residential', 'commercial', 'industrial', 'office', 'hospital',
+        'school', 'hotel', 'public', 'religious'
+    ])
+}
+_UNKNOWN_TYPE_CODE = len(_TYPE_CODES)
+_LUT_TYPES = list(_TYPE_CODES) + ['']
+
+# Spécifications officielles Malaysia (kWh/heure pour 100m²)
+_CONSUMPTION_SPECS = {
+    'residential': {'base': 0.5, 'peak': 12.0},
+    'commercial': {'base': 5.0, 'peak': 80.0},
+    'industrial': {'base': 20.0, 'peak': 200.0},
+    'office': {'base': 3.0, 'peak': 45.0},
+    'hospital': {'base': 25.0, 'peak': 70.0},
+    'school': {'base': 1.0, 'peak': 25.0},
+    'hotel': {'base': 8.0, 'peak': 40.0},
+    'public': {'base': 3.0, 'peak': 45.0},  # Comme office
+    'religious': {'base': 1.0, 'peak': 15.0}
+}
+
+# consommation de base par code de type (types inconnus = résidentiel)
+_BASE_CONSUMPTIONS = np.array([
+    _CONSUMPTION_SPECS.get(t, _CONSUMPTION_SPECS['residential'])['base'] for t in _LUT_TYPES
+])
+
+# tables de facteurs: ligne = code du type (dernière ligne = types inconnus)
+_HOURLY_FACTORS = np.array([[_hourly_factor_rule(hour, t) for hour in range(24)] for t in _LUT_TYPES])
+_DAILY_FACTORS = np.array([[_daily_factor_rule(weekday, t) for weekday in range(7)] for t in _LUT_TYPES])
+_SEASONAL_FACTORS = np.array([_seasonal_factor_rule(month) for month in range(13)])
+_RAMADAN_FACTORS = np.array([
+    [[_ramadan_factor_rule(month, hour, t) for hour in range(24)] for month in range(13)]
+    for t in _LUT_TYPES
+])
+
+# jours / mois où les facteurs hebdomadaires / Ramadan diffèrent de 1.0 pour au moins un type
+_DAILY_ACTIVE_WEEKDAYS = np.flatnonzero((_DAILY_FACTORS != 1.0).any(axis=0))
+_RAMADAN_ACTIVE_MONTHS = np.flatnonzero((_RAMADAN_FACTORS != 1.0).any(axis=(0, 2)))
+
+
+@functools.lru_cache(maxsize=32)
+def _decompose_range(start_date: str, end_date: str, frequency: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Index temporel d'une période décomposé en tableaux NumPy, mis en cache par période
+    
+    Les appels répétés avec les mêmes paramètres (tableaux de bord, régénérations)
+    réutilisent l'index et ses composantes calendaires au lieu de les recalculer.
+    
+    Returns:
+        Tuple: (horodatages datetime64[ns], heures, jours de la semaine, mois,
+        durée de l'intervalle en heures), tableaux en lecture seule car partagés
+    """
+    date_range = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    
+    # composantes calendaires extraites en une fois pour tout l'index (int8: valeurs < 32)
+    timestamps = date_range.values
+    hours = date_range.hour.to_numpy().astype(np.int8)
+    weekdays = date_range.weekday.to_numpy().astype(np.int8)
+    months = date_range.month.to_numpy().astype(np.int8)
+    for array in (timestamps, hours, weekdays, months):
+        array.flags.writeable = False
+    
+    # durée de l'intervalle (constante pour toute la période)
+    if len(date_range) > 1:
+        interval_hours = (date_range[1] - date_range[0]).total_seconds() / 3600
+    else:
+        interval_hours = 1.0
+    
+    return timestamps, hours, weekdays, months, interval_hours
+
+
+# attributs des bâtiments lus par le générateur
+_BUILDING_COLUMNS = ('id', 'building_type', 'surface_area_m2', 'latitude', 'longitude', 'zone_name')
+
+
+@functools.lru_cache(maxsize=32)
+def _type_factors(start_date: str, end_date: str, frequency: str) -> np.ndarray:
+    """
+    Facteurs combinés (heure × jour × saison × Ramadan) de chaque point pour chaque type
+    
+    Ces facteurs ne dépendent que du type et de l'horodatage: ils sont calculés
+    une fois par période pour tous les types (mis en cache comme _decompose_range)
+    puis partagés par les bâtiments et les générations suivantes.
+    
+    Returns:
+        np.ndarray: tableau (codes de type, points) en lecture seule, dernière ligne = types inconnus
+    """
+    _, hours, weekdays, months, _ = _decompose_range(start_date, end_date, frequency)
+    
+    factors = _HOURLY_FACTORS[:, hours]                         # 1. Pattern tropical
+    
+    # 2. Pattern hebdomadaire (facteurs à 1.0 sur une période sans week-end: multiplication évitée)
+    if np.isin(weekdays, _DAILY_ACTIVE_WEEKDAYS).any():
+        factors *= _DAILY_FACTORS[:, weekdays]
+    
+    factors *= _SEASONAL_FACTORS[months]                        # 3. Pattern saisonnier
+    
+    # 4. Pattern Ramadan (uniquement si la période couvre un mois de Ramadan)
+    if np.isin(months, _RAMADAN_ACTIVE_MONTHS).any():
+        factors *= _RAMADAN_FACTORS[:, months, hours]
+    
+    factors.flags.writeable = False
+    
+    return factors
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _frame_kernel(base_consumptions, type_codes, type_factors, random_factors, interval_hours, out):
+        """
+        Consommation de tous les bâtiments en une passe compilée (une ligne de `out` par bâtiment)
+        
+        Même calcul que _generate_building_timeseries, dans le même ordre pour des
+        résultats identiques: bâtiments répartis entre les threads (prange),
+        aucun tableau intermédiaire.
+        """
+        for j in prange(base_consumptions.size):
+            pattern_factors = type_factors[type_codes[j]]
+            for i in range(pattern_factors.size):
+                value = pattern_factors[i] * base_consumptions[j] * random_factors[j, i] * interval_hours
+                out[j, i] = value if value > 0.001 else 0.001
+        return out
+
+
+def _repeat_categorical(values, repeats: int) -> pd.Categorical:
+    """Répète chaque valeur `repeats` fois sous forme catégorielle (seuls les codes sont répétés)"""
+    categorical = pd.Categorical(values)
+    return pd.Categorical.from_codes(np.repeat(categorical.codes, repeats), dtype=categorical.dtype)
+
+
+def flatten_timeseries(timeseries_df: pd.DataFrame, buildings_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reconstruit le format plat (attributs répétés sur chaque point) d'une génération
+    faite avec split_metadata=True
+    
+    Args:
+        timeseries_df: séries [building_id, timestamp, consumption_kwh]
+        buildings_df: attributs des bâtiments, une ligne par bâtiment
+    
+    Returns:
+        pd.DataFrame: mêmes colonnes que generate_timeseries_data sans séparation
+    """
+    if timeseries_df.empty:
+        return pd.DataFrame()
+    
+    return timeseries_df.merge(buildings_df, on='building_id', how='left', sort=False)
+
+
 class ElectricityDataGenerator:
     """Générateur de données électriques réalistes"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.generation_count = 0
+        
+        # générateur aléatoire PCG64 (graine optionnelle pour des générations reproductibles)
+        self._rng = np.random.default_rng(seed)
     
     def generate_timeseries_data(
         self, 
         buildings: List[Dict], 
         start_date: str, 
         end_date: str, 
-        frequency: str = '1H'
+        frequency: str = '1H',
+        n_jobs: Optional[int] = None,
+        split_metadata: bool = False
     ) -> Dict:
         """
         Génère des données de consommation électrique pour les bâtiments
+        
+        Les bâtiments sont répartis par blocs contigus entre `n_jobs` threads
+        (AppConfig.GENERATION_WORKERS par défaut): chaque thread écrit dans les
+        tranches de ses bâtiments, les calculs NumPy libérant le GIL. Les variations
+        aléatoires étant tirées avant, le résultat ne dépend pas du nombre de threads.
+        
+        Avec `split_metadata`, 'data' ne contient que [building_id, timestamp,
+        consumption_kwh] et les attributs constants des bâtiments sont renvoyés une
+        seule fois dans 'buildings' (voir flatten_timeseries pour le format plat).
         """
         start_time = time.time()
         self.generation_count += 1
@@ -768,30 +1107,37 @@ class ElectricityDataGenerator:
         logger.info(f"⚡ Génération données électriques pour {len(buildings)} bâtiments")
         
         try:
-            # Créer l'index temporel
-            date_range = pd.date_range(start=start_date, end=end_date, freq=frequency)
+            # Index temporel décomposé (mis en cache par période)
+            timestamps, _, _, _, interval_hours = _decompose_range(start_date, end_date, frequency)
             
-            # Générer les données pour chaque bâtiment
-            all_data = []
+            # facteurs combinés de chaque point, calculés une fois par type (et non par bâtiment)
+            type_factors = _type_factors(start_date, end_date, frequency)
             
-            for building in buildings:
-                building_data = self._generate_building_timeseries(
-                    building, date_range
-                )
-                all_data.extend(building_data)
+            # détail des premiers points du premier bâtiment uniquement, en DEBUG
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             
-            # Créer le DataFrame final
-            df = pd.DataFrame(all_data)
+            buildings_df = None
+            if buildings:
+                df = self._generate_frame(
+                    buildings, timestamps, type_factors, interval_hours, n_jobs,
+                    debug=debug_enabled, split_metadata=split_metadata
+                )
+                if split_metadata:
+                    df, buildings_df = df
+            else:
+                df = pd.DataFrame()
+                if split_metadata:
+                    buildings_df = pd.DataFrame()
             
             generation_time = time.time() - start_time
             
-            logger.info(f"✅ {len(all_data)} points de données générés en {generation_time:.1f}s")
+            logger.info(f"✅ {len(df)} points de données générés en {generation_time:.1f}s")
             
-            return {
+            result = {
                 'success': True,
                 'data': df,
                 'metadata': {
-                    'total_points': len(all_data),
+                    'total_points': len(df),
                     'buildings_count': len(buildings),
                     'date_range': {
                         'start': start_date,
@@ -801,6 +1147,10 @@ class ElectricityDataGenerator:
                     'generation_time_seconds': generation_time
                 }
             }
+            if split_metadata:
+                result['buildings'] = buildings_df
+            
+            return result
             
         except Exception as e:
             logger.error(f"❌ Erreur génération: {str(e)}")
@@ -808,264 +1158,300 @@ class ElectricityDataGenerator:
                 'success': False,
                 'error': str(e)
             }
-
-    def _estimate_base_consumption(self, building_type: str, surface_area: float) -> float:
+    
+    def iter_timeseries(
+        self,
+        buildings: List[Dict],
+        start_date: str,
+        end_date: str,
+        frequency: str = '1H',
+        batch_buildings: int = 1000,
+        n_jobs: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
         """
-        Estime la consommation de base selon les spécifications Malaysia officielles
-        
-        NOUVELLES VALEURS OFFICIELLES (kWh/heure base):
-        - Residential: 0.5 kWh (base) → 12.0 kWh (pic)
-        - Commercial: 5.0 kWh (base) → 80.0 kWh (pic)  
-        - Industrial: 20.0 kWh (base) → 200.0 kWh (pic)
-        - Office: 3.0 kWh (base) → 45.0 kWh (pic)
-        - Hospital: 25.0 kWh (base) → 70.0 kWh (pic)
-        - School: 1.0 kWh (base) → 25.0 kWh (pic)
-        - Hotel: 8.0 kWh (base) → 40.0 kWh (pic)
+        Génère les données par lots de bâtiments, un DataFrame par lot
+        
+        Chaque lot est produit à la demande: le consommateur (base de données,
+        alimentation d'un entraînement...) le traite avant que le suivant soit généré
+        et seul le lot courant est en mémoire. `batch_buildings` règle le compromis:
+        des lots plus petits bornent mieux la mémoire, des lots plus grands réduisent
+        le surcoût par lot. Les variations aléatoires sont tirées lot par lot dans
+        l'ordre des bâtiments: à graine égale, la concaténation des lots est identique
+        au résultat de generate_timeseries_data.
+        
+        Args:
+            buildings: bâtiments à générer
+            start_date: date de début
+            end_date: date de fin
+            frequency: fréquence d'échantillonnage
+            batch_buildings: nombre de bâtiments par lot
+            n_jobs: nombre de threads par lot (AppConfig.GENERATION_WORKERS par défaut)
+        
+        Returns:
+            Iterator[pd.DataFrame]: lots successifs (mêmes colonnes que generate_timeseries_data)
         """
-        # Spécifications officielles Malaysia
-        specs = {
-            'residential': {'base': 0.5, 'peak': 12.0},
-            'commercial': {'base': 5.0, 'peak': 80.0},
-            'industrial': {'base': 20.0, 'peak': 200.0},
-            'office': {'base': 3.0, 'peak': 45.0},
-            'hospital': {'base': 25.0, 'peak': 70.0},
-            'school': {'base': 1.0, 'peak': 25.0},
-            'hotel': {'base': 8.0, 'peak': 40.0},
-            'public': {'base': 3.0, 'peak': 45.0},  # Comme office
-            'religious': {'base': 1.0, 'peak': 15.0}
-        }
-        
-        building_spec = specs.get(building_type, specs['residential'])
-        base_unit_consumption = building_spec['base']  # kWh/heure pour 100m²
-        
-        # Facteur de surface (référence 100m²)
-        surface_factor = surface_area / 100.0
-        surface_factor = max(0.1, min(surface_factor, 10.0))  # Limiter 10m² à 1000m²
-        
-        # Consommation de base finale (kWh/heure)
-        base_consumption = base_unit_consumption * surface_factor
+        self.generation_count += 1
         
-        return max(0.1, min(base_consumption, 500.0))  # Limites de sécurité
+        timestamps, _, _, _, interval_hours = _decompose_range(start_date, end_date, frequency)
+        type_factors = _type_factors(start_date, end_date, frequency)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        batch_buildings = max(1, batch_buildings)
         
-    def _generate_building_timeseries(self, building: Dict, date_range: pd.DatetimeIndex) -> List[Dict]:
-        """Génère la série temporelle avec TOUS les patterns Malaysia"""
-        building_id = building['id']
-        building_type = building['building_type']
-        surface_area = building.get('surface_area_m2', 100)
+        for k in range(0, len(buildings), batch_buildings):
+            yield self._generate_frame(
+                buildings[k:k + batch_buildings], timestamps, type_factors, interval_hours,
+                n_jobs, debug=debug_enabled and k == 0
+            )
+    
+    def generate_timeseries_data_streaming(
+        self,
+        buildings: List[Dict],
+        start_date: str,
+        end_date: str,
+        output_path: str,
+        frequency: str = '1H',
+        chunk_buildings: int = 1000,
+        n_jobs: Optional[int] = None
+    ) -> Dict:
+        """
+        Génère les données par paquets de bâtiments écrits en flux dans un fichier Parquet
+        
+        Seul le paquet courant est en mémoire (un row group snappy par paquet): la mémoire
+        reste bornée par `chunk_buildings` × nombre de points quel que soit le nombre de
+        bâtiments. Des paquets plus grands réduisent le nombre de row groups et le surcoût
+        par paquet au prix de plus de mémoire. Les variations aléatoires sont tirées
+        paquet par paquet dans l'ordre des bâtiments: à graine égale, le fichier contient
+        les mêmes données que generate_timeseries_data.
+        """
+        start_time = time.time()
         
-        # Consommation de base (kWh/heure) selon spécifications Malaysia
-        base_consumption_hourly = self._estimate_base_consumption(building_type, surface_area)
+        logger.info(f"⚡ Génération en flux pour {len(buildings)} bâtiments vers {output_path}")
         
-        data_points = []
+        writer = None
+        total_points = 0
         
-        for timestamp in date_range:
-            # 1. Facteur horaire tropical Malaysia
-            hour_factor = self._get_hourly_factor(timestamp.hour, building_type)
-            
-            # 2. Facteur hebdomadaire Malaysia  
-            day_factor = self._get_daily_factor(timestamp.weekday(), building_type)
-            
-            # 3. Facteur saisonnier Malaysia
-            seasonal_factor = self._get_seasonal_factor(timestamp.month)
-            
-            # 4. Facteur Ramadan Malaysia
-            ramadan_factor = self._get_ramadan_factor(timestamp.month, timestamp.hour, building_type)
-            
-            # 5. Variation aléatoire réaliste
-            random_factor = np.random.normal(1.0, 0.05)  # ±5% seulement
-            random_factor = max(0.8, min(random_factor, 1.2))  # Limiter
-            
-            # 6. Calcul de la durée de l'intervalle
-            if len(date_range) > 1:
-                interval_hours = (date_range[1] - date_range[0]).total_seconds() / 3600
-            else:
-                interval_hours = 1.0
+        try:
+            try:
+                for frame in self.iter_timeseries(
+                    buildings, start_date, end_date, frequency, batch_buildings=chunk_buildings, n_jobs=n_jobs
+                ):
+                    # index des catégories en int32: même schéma pour tous les paquets
+                    table = pa.Table.from_pandas(frame, preserve_index=False)
+                    table = table.cast(pa.schema([
+                        pa.field(field.name, pa.dictionary(pa.int32(), field.type.value_type))
+                        if pa.types.is_dictionary(field.type) else field
+                        for field in table.schema
+                    ], metadata=table.schema.metadata))
+                    
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, table.schema, compression='snappy')
+                    writer.write_table(table)
+                    total_points += len(frame)
+            finally:
+                if writer is not None:
+                    writer.close()
             
-            # 7. CALCUL FINAL avec tous les patterns Malaysia
-            consumption = (base_consumption_hourly *      # Base kWh/h
-                        hour_factor *                   # Pattern tropical
-                        day_factor *                    # Pattern hebdomadaire
-                        seasonal_factor *               # Pattern saisonnier  
-                        ramadan_factor *                # Pattern Ramadan
-                        random_factor *                 # Variation réaliste
-                        interval_hours)                 # Durée de l'intervalle
+            generation_time = time.time() - start_time
             
-            # 8. Limites de sécurité
-            consumption = max(0.001, consumption)  # Minimum technique
+            logger.info(f"✅ {total_points} points de données écrits en {generation_time:.1f}s")
             
-            # 9. Vérification cohérence (optionnel pour debug)
-            if len(data_points) < 3:  # Log les premiers points
-                logger.info(f"🔍 Point {len(data_points)+1} - {building_type} {surface_area}m²:")
-                logger.info(f"   Base: {base_consumption_hourly:.3f} kWh/h")
-                logger.info(f"   Facteurs: hour={hour_factor:.2f}, day={day_factor:.2f}, season={seasonal_factor:.2f}, ramadan={ramadan_factor:.2f}")
-                logger.info(f"   Intervalle: {interval_hours:.2f}h")
-                logger.info(f"   Final: {consumption:.4f} kWh")
+            return {
+                'success': True,
+                'data': None,
+                'metadata': {
+                    'total_points': total_points,
+                    'buildings_count': len(buildings),
+                    'output_path': output_path,
+                    'date_range': {
+                        'start': start_date,
+                        'end': end_date,
+                        'frequency': frequency
+                    },
+                    'generation_time_seconds': generation_time
+                }
+            }
             
-            data_points.append({
-                'building_id': building_id,
-                'timestamp': timestamp,
-                'consumption_kwh': round(consumption, 4),
-                'building_type': building_type,
-                'latitude': building['latitude'],
-                'longitude': building['longitude'],
-                'zone_name': building['zone_name']
-            })
-        
-        return data_points
+        except Exception as e:
+            logger.error(f"❌ Erreur génération en flux: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
     
-    def _get_hourly_factor(self, hour: int, building_type: str) -> float:
+    def _generate_frame(
+        self,
+        buildings: List[Dict],
+        timestamps: np.ndarray,
+        type_factors: np.ndarray,
+        interval_hours: float,
+        n_jobs: Optional[int] = None,
+        debug: bool = False,
+        split_metadata: bool = False
+    ):
         """
-        Facteurs horaires selon le climat tropical Malaysia
-        
-        Patterns officiels:
-        - 6h-8h : Pic matinal (avant la chaleur) 
-        - 11h-16h : Maximum de climatisation (heures les plus chaudes)
-        - 17h-21h : Activité élevée (après-midi/soirée)
-        - 22h-5h : Consommation nocturne réduite
+        Génère le DataFrame de consommation d'une liste (non vide) de bâtiments
+        
+        Args:
+            buildings: bâtiments à générer
+            timestamps: horodatages de la période (voir _decompose_range)
+            type_factors: facteurs combinés par type (voir _type_factors)
+            interval_hours: durée de l'intervalle en heures
+            n_jobs: nombre de threads (AppConfig.GENERATION_WORKERS par défaut)
+            debug: détail des premiers points du premier bâtiment
+            split_metadata: séparer les attributs constants des séries
+        
+        Returns:
+            pd.DataFrame: une ligne par bâtiment et par horodatage, ou avec
+            `split_metadata` le tuple (séries, attributs des bâtiments)
         """
-        # Facteurs nocturnes par type
-        night_factors = {
-            'residential': 0.3, 'commercial': 0.2, 'industrial': 0.7,
-            'office': 0.1, 'hospital': 0.8, 'school': 0.05,
-            'hotel': 0.6, 'public': 0.1, 'religious': 0.05
-        }
+        num_points = len(timestamps)
+        
+        # attributs des bâtiments extraits une fois en colonnes (pas d'accès par dictionnaire
+        # bâtiment par bâtiment), types convertis en codes entiers des tables de facteurs
+        buildings_df = pd.DataFrame.from_records(buildings, columns=list(_BUILDING_COLUMNS))
+        building_types = buildings_df['building_type'].to_numpy()
+        type_codes = pd.Categorical(building_types, categories=list(_TYPE_CODES)).codes
+        type_codes = np.where(type_codes < 0, _UNKNOWN_TYPE_CODE, type_codes)
+        surface_areas = buildings_df['surface_area_m2'].fillna(100).to_numpy(dtype=np.float64)
+        base_consumptions = self._estimate_base_consumptions(type_codes, surface_areas)
+        
+        # variations aléatoires de tous les points de tous les bâtiments en un seul tirage
+        # (±5%, limitées à 20%), une ligne par bâtiment
+        random_factors = self._rng.normal(1.0, 0.05, size=(len(buildings), num_points))
+        np.clip(random_factors, 0.8, 1.2, out=random_factors)
+        
+        # colonne de consommation pré-allouée: chaque bâtiment écrit dans sa tranche
+        consumptions = np.empty(len(buildings) * num_points, dtype=np.float32)
+        
+        def generate_block(block: range):
+            for i in block:
+                self._generate_building_timeseries(
+                    building_types[i], type_codes[i], base_consumptions[i],
+                    type_factors, random_factors[i], interval_hours,
+                    out=consumptions[i * num_points:(i + 1) * num_points],
+                    debug=debug and i == 0
+                )
         
-        night_factor = night_factors.get(building_type, 0.3)
+        # -1 = tous les coeurs (comme le générateur du coeur), au moins 1, au plus un par bâtiment
+        requested_workers = n_jobs or AppConfig.GENERATION_WORKERS
+        workers = (os.cpu_count() or 1) if requested_workers == -1 else max(1, requested_workers)
+        workers = max(1, min(workers, len(buildings)))
+        if NUMBA_AVAILABLE and not debug:
+            # noyau compilé: bâtiments répartis sur `workers` threads numba, hors GIL
+            # (réglage propre au thread appelant, rétabli ensuite pour les autres noyaux)
+            previous_threads = get_num_threads()
+            set_num_threads(min(workers, numba_config.NUMBA_NUM_THREADS))
+            try:
+                _frame_kernel(
+                    base_consumptions, type_codes, type_factors, random_factors, interval_hours,
+                    consumptions.reshape(len(buildings), num_points)
+                )
+            finally:
+                set_num_threads(previous_threads)
+        elif workers > 1:
+            block_size = -(-len(buildings) // workers)
+            blocks = [range(k, min(k + block_size, len(buildings))) for k in range(0, len(buildings), block_size)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(generate_block, blocks))
+        else:
+            generate_block(range(len(buildings)))
         
-        if building_type == 'residential':
-            if 6 <= hour <= 8:  # Pic matinal
-                return 1.4
-            elif 11 <= hour <= 16:  # Maximum climatisation  
-                return 2.0
-            elif 17 <= hour <= 21:  # Activité élevée
-                return 1.6
-            elif 22 <= hour <= 23 or 0 <= hour <= 5:  # Nuit
-                return night_factor
-            else:
-                return 1.0
-                
-        elif building_type == 'commercial':
-            if 9 <= hour <= 21:  # Ouvert
-                if 11 <= hour <= 16:  # Pic climatisation
-                    return 2.5
-                else:
-                    return 1.8
-            else:  # Fermé
-                return night_factor
-                
-        elif building_type == 'office':
-            if 8 <= hour <= 18:  # Heures bureau
-                if 11 <= hour <= 16:  # Pic climatisation
-                    return 3.0
-                else:
-                    return 2.0
-            else:  # Fermé
-                return night_factor
-                
-        elif building_type == 'school':
-            if 7 <= hour <= 15:  # Heures scolaires
-                if 11 <= hour <= 14:  # Pic climatisation
-                    return 5.0
-                else:
-                    return 3.0
-            else:  # Fermé
-                return night_factor
-                
-        elif building_type == 'hospital':
-            if 11 <= hour <= 16:  # Pic climatisation
-                return 1.8
-            elif 6 <= hour <= 22:  # Activité diurne
-                return 1.4
-            else:  # Nuit
-                return night_factor
-                
-        elif building_type == 'industrial':
-            if 11 <= hour <= 16:  # Pic climatisation
-                return 2.0
-            elif 6 <= hour <= 22:  # Production
-                return 1.5
-            else:  # Nuit
-                return night_factor
+        # arrondi à 4 décimales en place sur toute la colonne (pas de copie)
+        np.round(consumptions, 4, out=consumptions)
         
-        return 1.0
+        if split_metadata:
+            # attributs constants une seule fois par bâtiment, séries sans répétition
+            timeseries_df = pd.DataFrame({
+                'building_id': _repeat_categorical(buildings_df['id'], num_points),
+                'timestamp': np.tile(timestamps, len(buildings)),
+                'consumption_kwh': consumptions
+            })
+            attributes_df = pd.DataFrame({
+                'building_id': pd.Categorical(buildings_df['id']),
+                'building_type': pd.Categorical(building_types),
+                'latitude': buildings_df['latitude'].to_numpy(dtype=np.float32),
+                'longitude': buildings_df['longitude'].to_numpy(dtype=np.float32),
+                'zone_name': pd.Categorical(buildings_df['zone_name'])
+            })
+            return timeseries_df, attributes_df
+        
+        # Créer le DataFrame final en une fois: horodatages répétés par bâtiment,
+        # attributs constants répétés sur chaque point (chaînes en catégories dont
+        # seuls les codes sont répétés, coordonnées en float32)
+        return pd.DataFrame({
+            'building_id': _repeat_categorical(buildings_df['id'], num_points),
+            'timestamp': np.tile(timestamps, len(buildings)),
+            'consumption_kwh': consumptions,
+            'building_type': _repeat_categorical(building_types, num_points),
+            'latitude': np.repeat(buildings_df['latitude'].to_numpy(dtype=np.float32), num_points),
+            'longitude': np.repeat(buildings_df['longitude'].to_numpy(dtype=np.float32), num_points),
+            'zone_name': _repeat_categorical(buildings_df['zone_name'], num_points)
+        })
     
-    def _get_daily_factor(self, weekday: int, building_type: str) -> float:
+    def _estimate_base_consumptions(self, type_codes: np.ndarray, surface_areas: np.ndarray) -> np.ndarray:
         """
-        Facteurs hebdomadaires Malaysia:
+        Estime la consommation de base de tous les bâtiments (spécifications Malaysia officielles)
         
-        - Vendredi après-midi : Réduction d'activité (prière du vendredi)
-        - Weekend : Plus de consommation résidentielle
-        - Jours ouvrables : Pics dans les bureaux/commerces
-        """
-        # 0=Lundi, 4=Vendredi, 5=Samedi, 6=Dimanche
-        is_weekend = weekday >= 5
+        Args:
+            type_codes: code du type de chaque bâtiment (voir _TYPE_CODES)
+            surface_areas: surface de chaque bâtiment (m²)
         
-        if building_type == 'residential':
-            return 1.2 if is_weekend else 1.0
-            
-        elif building_type in ['office', 'commercial']:
-            if is_weekend:
-                return 0.4  # Fermé week-end
-            else:
-                return 1.0
-                
-        elif building_type == 'school':
-            return 0.05 if is_weekend else 1.0  # École fermée
-            
-        elif building_type in ['hospital', 'hotel']:
-            return 1.0  # Pas d'impact majeur
-            
-        elif building_type == 'industrial':
-            return 0.7 if is_weekend else 1.0  # Production réduite
-            
-        else:
-            return 1.0
-    
-    def _get_seasonal_factor(self, month: int) -> float:
+        Returns:
+            np.ndarray: consommation de base (kWh/heure) de chaque bâtiment
         """
-        Facteurs saisonniers Malaysia selon le document officiel:
+        surface_factors = np.clip(surface_areas / 100.0, 0.1, 10.0)  # Limiter 10m² à 1000m²
         
-        - Nov-Fév: Mousson NE (0.9-1.1×) - Moins de climatisation
-        - Mar-Avr: Transition (1.2-1.5×) - Période chaude + Ramadan  
-        - Mai-Août: Saison sèche (1.3-1.7×) - Maximum de climatisation
-        - Sep-Oct: Variable (1.0-1.3×) - Climat changeant
-        """
-        seasonal_factors = {
-            # Mousson NE - Moins de climatisation
-            11: 0.95, 12: 0.9, 1: 0.9, 2: 1.0,
-            
-            # Transition - Période chaude + Ramadan
-            3: 1.3, 4: 1.4,
-            
-            # Saison sèche - Maximum de climatisation
-            5: 1.5, 6: 1.6, 7: 1.7, 8: 1.6,
-            
-            # Variable - Climat changeant  
-            9: 1.2, 10: 1.1
-        }
+        return np.clip(_BASE_CONSUMPTIONS[type_codes] * surface_factors, 0.1, 500.0)  # Limites de sécurité
         
-        return seasonal_factors.get(month, 1.0)
-
-    def _get_ramadan_factor(self, month: int, hour: int, building_type: str) -> float:
+    def _generate_building_timeseries(
+        self, 
+        building_type: str, 
+        type_code: int,
+        base_consumption_hourly: float,
+        type_factors: np.ndarray,
+        random_factors: np.ndarray,
+        interval_hours: float,
+        out: Optional[np.ndarray] = None,
+        debug: bool = False
+    ) -> np.ndarray:
         """
-        Facteurs Ramadan (Mar-Avr approximatif):
-        
-        - 4h-17h : Consommation réduite de 40% (jeûne)
-        - 18h-23h : Consommation augmentée de 40% (Iftar, activités nocturnes)
+        Génère la série temporelle avec TOUS les patterns Malaysia
+        
+        Calcul vectorisé sur toute la période: les facteurs de chaque point sont lus
+        dans la ligne du type du bâtiment (voir _type_factors), les variations
+        aléatoires sont tirées par l'appelant pour tous les bâtiments à la fois.
+        Le résultat est écrit dans `out` (tranche de la colonne de consommation) si fourni.
+        La durée de l'intervalle, le code du type et la consommation de base (kWh/heure,
+        voir _estimate_base_consumptions) sont calculés une fois par l'appelant;
+        `debug` active le détail des premiers points.
         """
-        # Ramadan approximatif en Mars-Avril
-        if month not in [3, 4]:
-            return 1.0
-            
-        if building_type in ['residential', 'commercial']:
-            if 4 <= hour <= 17:  # Période de jeûne
-                return 0.6  # Réduction de 40%
-            elif 18 <= hour <= 23:  # Iftar et activités nocturnes
-                return 1.4  # Augmentation de 40%
-            else:
-                return 1.0
-        else:
-            return 1.0  # Hôpitaux, industriel moins affectés
+        # 1-4. Patterns tropical, hebdomadaire, saisonnier et Ramadan du type du bâtiment
+        pattern_factors = type_factors[type_code]
+        num_points = len(pattern_factors)
+        
+        # 5. CALCUL FINAL avec tous les patterns Malaysia, sur toute la série
+        # (un seul tampon: les facteurs suivants sont appliqués en place, sans temporaires)
+        consumption = np.multiply(pattern_factors, base_consumption_hourly)  # Base kWh/h × patterns Malaysia combinés
+        consumption *= random_factors                                        # Variation réaliste
+        consumption *= interval_hours                                        # Durée de l'intervalle
+        
+        # 6. Limites de sécurité
+        np.maximum(consumption, 0.001, out=consumption)  # Minimum technique
+        
+        # 7. Vérification cohérence (debug uniquement)
+        if debug:
+            for k in range(min(3, num_points)):  # Log les premiers points
+                logger.debug(f"🔍 Point {k+1} - {building_type}:")
+                logger.debug(f"   Base: {base_consumption_hourly:.3f} kWh/h")
+                logger.debug(f"   Facteurs combinés: {pattern_factors[k]:.2f}")
+                logger.debug(f"   Intervalle: {interval_hours:.2f}h")
+                logger.debug(f"   Final: {consumption[k]:.4f} kWh")
+        
+        if out is None:
+            return consumption.astype(np.float32)
+        
+        out[:] = consumption
+        return out
     
     def get_statistics(self) -> Dict:
         """Statistiques du générateur"""
@@ -54,6 +54,16 @@ class OSMConfig:
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # secondes entre les tentatives
     
+    # Politique d'usage Overpass: débit et requêtes simultanées par serveur
+    OVERPASS_RATE_PER_SECOND = 0.5  # 1 requête toutes les 2 secondes
+    OVERPASS_MAX_CONCURRENT = 2
+    
+    # Cache disque des réponses Overpass / Nominatim (clé: hash de la requête)
+    CACHE_ENABLED = os.environ.get('OSM_CACHE_ENABLED', 'True').lower() == 'true'
+    CACHE_PATH = os.environ.get('OSM_CACHE_PATH', os.path.join(AppConfig.DATA_DIR, 'osm_cache.sqlite'))
+    CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7 jours
+    CACHE_MAX_BYTES = int(os.environ.get('OSM_CACHE_MAX_BYTES', 20 * 1024 ** 3))  # 20 Go
+    
     # Limites de sécurité
     MAX_BUILDINGS_PER_QUERY = 100000
     MAX_AREA_SIZE_KM2 = 500  # taille maximale de zone en km²
@@ -94,6 +104,14 @@ class GenerationConfig:
     MIN_BUILDINGS = 1
     MIN_DAYS = 1
     
+    # Graine du générateur aléatoire (None = données différentes à chaque génération,
+    # entier = génération reproductible)
+    SEED = None
+    
+    # Parallélisme de la génération: threads numba, ou processus sans numba
+    # (1 = séquentiel, -1 = tous les coeurs)
+    N_JOBS = int(os.environ.get('GENERATION_N_JOBS', -1))
+    
     # Facteurs climatiques Malaysia
     MALAYSIA_CLIMATE = {
         'base_temperature': 28,  # °C température moyenne
@@ -534,6 +552,7 @@ class ExportConfig:
     # Configuration Parquet
     PARQUET_COMPRESSION = 'snappy'
     PARQUET_ENGINE = 'pyarrow'
+    PARQUET_ROW_GROUP_SIZE = 1_000_000  # lignes par row group
     
     # Noms de fichiers par défaut
     DEFAULT_BUILDINGS_FILENAME = 'buildings_metadata'
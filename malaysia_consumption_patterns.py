@@ -9,7 +9,7 @@ climatiques tropicaux, saisonniers, hebdomadaires et Ramadan.
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import calendar
 
 # ==============================================================================
@@ -202,6 +202,83 @@ class TropicalHourlyPatterns:
         
         # Fallback
         return 1.0
+    
+    @staticmethod
+    def get_hourly_factors(hours: np.ndarray, building_type: str) -> np.ndarray:
+        """
+        Facteurs horaires d'un tableau d'heures (version vectorisée de get_hourly_factor)
+        
+        Chaque type est décrit par ses plages horaires (conditions évaluées dans
+        l'ordre, la première vraie l'emporte) et np.select les applique à toutes
+        les heures à la fois, sans branchement par point.
+        
+        Args:
+            hours: heures de la journée (0-23)
+            building_type: Type de bâtiment
+            
+        Returns:
+            np.ndarray: facteur horaire de chaque heure
+        """
+        specs = MalaysiaConsumptionPatterns.BUILDING_CONSUMPTION_SPECS.get(
+            building_type, 
+            MalaysiaConsumptionPatterns.BUILDING_CONSUMPTION_SPECS['residential']
+        )
+        
+        night_factor = specs['night_factor']
+        hours = np.asarray(hours)
+        peak_cooling = (hours >= 11) & (hours <= 16)  # Maximum climatisation
+        
+        if building_type == 'residential':
+            conditions = [
+                (hours >= 6) & (hours <= 8),     # Pic matinal
+                peak_cooling,                    # Pic maximum (vers peak_kwh)
+                (hours >= 17) & (hours <= 21),   # Activité élevée
+                (hours >= 22) | (hours <= 5)     # Nuit
+            ]
+            choices = [1.4, 2.0, 1.6, night_factor]
+            default = 1.0                        # Autres heures
+            
+        elif building_type == 'commercial':
+            # Heures d'ouverture 9h-21h, pic climatisation vers peak_kwh (80.0)
+            conditions = [peak_cooling, (hours >= 9) & (hours <= 21)]
+            choices = [2.5, 1.8]
+            default = 1.0
+            
+        elif building_type == 'office':
+            # Heures de bureau 8h-18h, pic climatisation vers peak_kwh (45.0)
+            conditions = [peak_cooling, (hours >= 8) & (hours <= 18)]
+            choices = [3.0, 2.0]
+            default = 1.0
+            
+        elif building_type == 'school':
+            # Heures scolaires 7h-15h, pic climatisation 11h-14h, école fermée sinon
+            conditions = [(hours >= 11) & (hours <= 14), (hours >= 7) & (hours <= 15)]
+            choices = [5.0, 3.0]
+            default = night_factor               # 0.05
+            
+        elif building_type in ['hospital', 'industrial']:
+            # Activité 24h/24 (hôpital) ou production (industriel) 6h-22h, pic climatisation
+            conditions = [peak_cooling, (hours >= 6) & (hours <= 22)]
+            choices = [1.8, 1.4] if building_type == 'hospital' else [2.0, 1.5]
+            default = night_factor               # 0.8 / 0.7
+            
+        elif building_type == 'restaurant':
+            # Pics aux heures de repas (déjeuner et dîner)
+            conditions = [np.isin(hours, [12, 13, 19, 20]), (hours >= 6) & (hours <= 23)]
+            choices = [4.0, 1.5]
+            default = night_factor               # 0.2
+            
+        elif building_type == 'hotel':
+            # Activité hôtelière 6h-23h, pic climatisation vers peak_kwh (40.0)
+            conditions = [peak_cooling, (hours >= 6) & (hours <= 23)]
+            choices = [1.8, 1.3]
+            default = night_factor               # 0.6
+            
+        else:
+            # Fallback
+            return np.ones(hours.shape)
+        
+        return np.select(conditions, choices, default=default)
 
 
 # ==============================================================================
@@ -295,10 +372,14 @@ class WeeklyPatterns:
 class RamadanPatterns:
     """Patterns spéciaux durant le Ramadan (Mar-Avr approximatif)"""
     
+    # Mois de Ramadan en table booléenne indexée par mois (Mars-Avril approximatif)
+    RAMADAN_MONTHS = np.zeros(13, dtype=bool)
+    RAMADAN_MONTHS[[3, 4]] = True
+    
     @staticmethod
     def is_ramadan_period(month: int) -> bool:
         """Vérifie si on est en période de Ramadan (approximatif)"""
-        return month in [3, 4]  # Mars-Avril approximatif
+        return bool(RamadanPatterns.RAMADAN_MONTHS[month])
     
     @staticmethod
     def get_ramadan_factor(hour: int, building_type: str) -> float:
@@ -323,21 +404,40 @@ class RamadanPatterns:
 # 6. GÉNÉRATEUR PRINCIPAL AVEC TOUS LES PATTERNS
 # ==============================================================================
 
+def _constant_categorical(value, repeats: int) -> pd.Categorical:
+    """Colonne catégorielle répétant `repeats` fois une même valeur (seul le code est répété)"""
+    if value is None:
+        return value  # valeur absente: diffusée telle quelle par le DataFrame
+    
+    categorical = pd.Categorical([value])
+    return pd.Categorical.from_codes(np.repeat(categorical.codes, repeats), dtype=categorical.dtype)
+
+
 class MalaysiaElectricityGenerator:
     """Générateur principal intégrant tous les patterns Malaysia"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialise le générateur avec tous les patterns Malaysia
+        
+        Args:
+            seed: graine du générateur aléatoire (None = non reproductible)
+        """
         self.consumption_patterns = MalaysiaConsumptionPatterns()
         self.tropical_patterns = TropicalHourlyPatterns()
         self.seasonal_patterns = SeasonalPatterns()
         self.weekly_patterns = WeeklyPatterns()
         self.ramadan_patterns = RamadanPatterns()
+        
+        # générateur aléatoire PCG64 partagé par tous les tirages (vectorisés par série)
+        self._rng = np.random.default_rng(seed)
     
     def generate_consumption(
         self, 
         building_type: str, 
         surface_area: float,
-        timestamp: pd.Timestamp
+        timestamp: pd.Timestamp,
+        random_factor: Optional[float] = None
     ) -> float:
         """
         Génère la consommation électrique pour un bâtiment à un moment donné
@@ -346,6 +446,7 @@ class MalaysiaElectricityGenerator:
             building_type: Type de bâtiment
             surface_area: Surface en m²
             timestamp: Moment de la consommation
+            random_factor: Variation aléatoire déjà tirée (tirée ici si absente)
             
         Returns:
             float: Consommation en kWh pour cette période
@@ -378,8 +479,9 @@ class MalaysiaElectricityGenerator:
             )
         
         # 6. Variation aléatoire réaliste
-        random_factor = np.random.normal(1.0, 0.05)  # Variation ±5%
-        random_factor = max(0.8, min(random_factor, 1.2))  # Limiter
+        if random_factor is None:
+            random_factor = self._rng.normal(1.0, 0.05)  # Variation ±5%
+            random_factor = max(0.8, min(random_factor, 1.2))  # Limiter
         
         # 7. Calcul final
         final_consumption = (base_consumption * 
@@ -410,34 +512,85 @@ class MalaysiaElectricityGenerator:
         Returns:
             List[Dict]: Série temporelle avec patterns Malaysia
         """
-        building_id = building['id']
+        return self.generate_building_timeseries_df(building, date_range).to_dict('records')
+    
+    def generate_building_timeseries_df(
+        self, 
+        building: Dict, 
+        date_range: pd.DatetimeIndex
+    ) -> pd.DataFrame:
+        """
+        Génère une série temporelle complète pour un bâtiment, en colonnes
+        
+        Aucun dictionnaire n'est créé par point et aucun appel scalaire n'est fait
+        par timestamp: chaque facteur ne dépend que de l'heure, du jour de la semaine
+        ou du mois, il est donc tabulé une fois par bâtiment puis indexé par les
+        tableaux de la plage temporelle, en une seule passe NumPy.
+        
+        Args:
+            building: Données du bâtiment  
+            date_range: Plage temporelle
+            
+        Returns:
+            pd.DataFrame: Série temporelle avec patterns Malaysia (une ligne par point)
+        """
         building_type = building['building_type']
         surface_area = building.get('surface_area_m2', 100)
         
-        data_points = []
+        base_consumption = self.consumption_patterns.get_base_consumption(
+            building_type, surface_area
+        )
         
-        for timestamp in date_range:
-            # Génération avec tous les patterns Malaysia
-            consumption = self.generate_consumption(
-                building_type, surface_area, timestamp
-            )
-            
-            data_points.append({
-                'building_id': building_id,
-                'timestamp': timestamp,
-                'consumption_kwh': round(consumption, 4),
-                'building_type': building_type,
-                'latitude': building['latitude'],
-                'longitude': building['longitude'],
-                'zone_name': building['zone_name'],
-                # Métadonnées de debug
-                '_surface_m2': surface_area,
-                '_hour_factor': self.tropical_patterns.get_hourly_factor(timestamp.hour, building_type),
-                '_seasonal_factor': self.seasonal_patterns.get_seasonal_factor(timestamp.month),
-                '_is_ramadan': self.ramadan_patterns.is_ramadan_period(timestamp.month)
-            })
-        
-        return data_points
+        # Tables des facteurs par heure / mois / (jour, heure) pour ce type de bâtiment
+        hour_factors = self.tropical_patterns.get_hourly_factors(np.arange(24), building_type)
+        seasonal_factors = np.array([
+            self.seasonal_patterns.get_seasonal_factor(month) for month in range(13)
+        ])
+        weekly_factors = np.array([
+            [self.weekly_patterns.get_weekly_factor(weekday, hour, building_type) for hour in range(24)]
+            for weekday in range(7)
+        ])
+        ramadan_factors = np.array([
+            self.ramadan_patterns.get_ramadan_factor(hour, building_type) for hour in range(24)
+        ])
+        
+        hours = date_range.hour.to_numpy()
+        weekdays = date_range.weekday.to_numpy()
+        months = date_range.month.to_numpy()
+        is_ramadan = self.ramadan_patterns.RAMADAN_MONTHS[months]
+        
+        # Variations aléatoires tirées en un seul appel pour toute la série (±5%, limitées)
+        random_factors = self._rng.normal(1.0, 0.05, size=len(date_range))
+        np.clip(random_factors, 0.8, 1.2, out=random_factors)
+        
+        # Même formule que generate_consumption, appliquée à toute la série
+        consumptions = (base_consumption *
+                        hour_factors[hours] *
+                        seasonal_factors[months] *
+                        weekly_factors[weekdays, hours] *
+                        np.where(is_ramadan, ramadan_factors[hours], 1.0) *
+                        random_factors)
+        
+        # Limites de sécurité: 1 Wh minimum, 50x la base maximum
+        consumptions = np.clip(consumptions, 0.001, base_consumption * 50).round(4)
+        
+        # Attributs texte constants en catégories: une seule chaîne, codes int8 répétés
+        num_points = len(date_range)
+        
+        return pd.DataFrame({
+            'building_id': _constant_categorical(building['id'], num_points),
+            'timestamp': date_range,
+            'consumption_kwh': consumptions,
+            'building_type': _constant_categorical(building_type, num_points),
+            'latitude': building['latitude'],
+            'longitude': building['longitude'],
+            'zone_name': _constant_categorical(building['zone_name'], num_points),
+            # Métadonnées de debug
+            '_surface_m2': surface_area,
+            '_hour_factor': hour_factors[hours],
+            '_seasonal_factor': seasonal_factors[months],
+            '_is_ramadan': is_ramadan
+        })
 
 
 # ==============================================================================
@@ -7,6 +7,8 @@ avec optimisation et validation automatique.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
 import logging
 from datetime import datetime
@@ -339,26 +341,25 @@ class DataExporter:
             logger.warning(f"⚠️ DataFrame {data_type} vide, export Parquet ignoré")
             return
         
-        # Optimisations spécifiques
-        df_optimized = df.copy()
-        
-        # Optimisation des types de données
-        for col in df_optimized.columns:
-            if df_optimized[col].dtype == 'object':
-                # Convertir les chaînes en catégories si répétitives
-                if df_optimized[col].nunique() / len(df_optimized) < 0.5:
-                    df_optimized[col] = df_optimized[col].astype('category')
+        # Conversion directe en table Arrow (pas de copie du DataFrame ni de passe nunique:
+        # les chaînes répétitives sont encodées en dictionnaire par Parquet)
+        table = pa.Table.from_pandas(df, preserve_index=False)
         
-        # Conversion des timestamps
-        if 'timestamp' in df_optimized.columns:
-            df_optimized['timestamp'] = pd.to_datetime(df_optimized['timestamp'])
+        # Conversion des timestamps (seulement s'ils ne sont pas déjà en datetime64)
+        if 'timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            table = table.set_column(
+                table.schema.get_field_index('timestamp'),
+                'timestamp',
+                pa.array(pd.to_datetime(df['timestamp']))
+            )
         
         # Export Parquet avec compression
-        df_optimized.to_parquet(
+        pq.write_table(
+            table,
             filepath,
-            engine=EXPORT_CONFIG.PARQUET_ENGINE,
             compression=EXPORT_CONFIG.PARQUET_COMPRESSION,
-            index=False
+            use_dictionary=True,
+            row_group_size=EXPORT_CONFIG.PARQUET_ROW_GROUP_SIZE
         )
         
         logger.info(f"✅ Parquet {data_type} exporté: {os.path.basename(filepath)}")
@@ -436,11 +437,13 @@ class DataExporter:
                 self.export_directory, f"{filename_prefix}_timeseries.json"
             )
             
-            # Structure optimisée par bâtiment
-            timeseries_grouped = {}
-            for building_id in timeseries_df['building_id'].unique():
-                building_data = timeseries_df[timeseries_df['building_id'] == building_id]
-                timeseries_grouped[building_id] = building_data.to_dict('records')
+            # Structure optimisée par bâtiment: un seul groupby (positions de chaque
+            # bâtiment calculées en une passe) au lieu d'un masque sur tout le DataFrame
+            # par bâtiment; ordre d'apparition des bâtiments conservé
+            timeseries_grouped = {
+                building_id: building_data.to_dict('records')
+                for building_id, building_data in timeseries_df.groupby('building_id', sort=False, observed=True)
+            }
             
             with open(timeseries_json_path, 'w', encoding='utf-8') as f:
                 json.dump(timeseries_grouped, f, indent=2, default=str)
@@ -6,15 +6,20 @@
 # fonctions :
 
 # generate_timeseries_data:  ---- données de consommation électrique
+# generate_timeseries_for_buildings:  ---- idem, depuis des objets Building
+# generate_timeseries_batches:  ---- idem, en flux de RecordBatch Arrow
+# generate_timeseries_dask:  ---- idem, partition par partition avec Dask (optionnel)
+# get_generation_summary:  ---- résumé statistique d'une génération
+# compute_total_observations:  ---- nombre de périodes et d'observations d'une génération
 
 
-### Base : _estimate_base_consumption: base + night factor
+### Base : _estimate_base_consumptions: base + night factor
 
-# 1/ Heure de la journée  // _get_hourly_factor
-# 2/ jour de la semaine // _get_daily_factor
-# 3/ saisons  // _get_seasonal_factor
-# 4/ ramadan // _get_ramadan_factor
-# 5/ vendridi  // _get_friday_prayer_factor
+# 1/ Heure de la journée  // _hourly_factor_rule (_HOURLY_FACTORS)
+# 2/ jour de la semaine // _daily_factors
+# 3/ saisons  // _SEASONAL_FACTORS (_SEASONAL_LUT)
+# 4/ ramadan // _cultural_factors
+# 5/ vendridi  // _cultural_factors
 # 6/ random (pour la variation des données)
 
 ### electricité finale =  base × heure × jour × saison × ramadan × vendredi × hasard
@@ -42,15 +47,495 @@
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import math
-import random
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import GEN_CONFIG
+
+# compilation JIT du noyau de calcul (optionnelle, repli NumPy sinon)
+try:
+    from numba import config as numba_config, get_num_threads, njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# génération partition par partition sur un cluster (optionnelle)
+try:
+    import dask.dataframe as dd
+    from dask.dataframe.utils import clear_known_categories
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
 
 # configuration du logger
 logger = logging.getLogger(__name__)
 
+# spécifications Malaysia par type de bâtiment: base / pic / facteur nuit (kWh/heure pour 100m²)
+_BUILDING_SPECS = {
+    'residential': {'base': 0.5, 'peak': 12.0, 'night': 0.3},
+    'commercial': {'base': 5.0, 'peak': 80.0, 'night': 0.2},
+    'industrial': {'base': 20.0, 'peak': 200.0, 'night': 0.7},
+    'office': {'base': 3.0, 'peak': 45.0, 'night': 0.1},
+    'hospital': {'base': 25.0, 'peak': 70.0, 'night': 0.8},
+    'school': {'base': 1.0, 'peak': 25.0, 'night': 0.05},
+    'hotel': {'base': 8.0, 'peak': 40.0, 'night': 0.6},
+    'public': {'base': 3.0, 'peak': 45.0, 'night': 0.1},
+    'religious': {'base': 1.0, 'peak': 15.0, 'night': 0.05}
+}
+
+# types connus (indice = code du type), les types inconnus prennent le dernier code
+_BUILDING_TYPES = list(_BUILDING_SPECS)
+_UNKNOWN_TYPE_CODE = len(_BUILDING_TYPES)
+
+# consommation de base indexée par code de type (types inconnus → base residential)
+_BASE_ARRAY = np.array(
+    [_BUILDING_SPECS[t]['base'] for t in _BUILDING_TYPES] + [_BUILDING_SPECS['residential']['base']],
+    dtype=np.float32
+)
+
+# facteurs nocturnes par type (repris des spécifications)
+_NIGHT_FACTORS = {t: spec['night'] for t, spec in _BUILDING_SPECS.items()}
+
+# facteurs saisonniers Malaysia par mois
+_SEASONAL_FACTORS = {
+    # Mousson NE - Moins de climatisation
+    11: 0.95, 12: 0.9, 1: 0.9, 2: 1.0,
+    
+    # Transition - Période chaude + Ramadan
+    3: 1.3, 4: 1.4,
+    
+    # Saison sèche - Maximum de climatisation
+    5: 1.5, 6: 1.6, 7: 1.7, 8: 1.6,
+    
+    # Variable - Climat changeant
+    9: 1.2, 10: 1.1
+}
+
+# facteurs saisonniers indexés par mois (indice 0 inutilisé)
+_SEASONAL_LUT = np.array(
+    [1.0] + [_SEASONAL_FACTORS.get(month, 1.0) for month in range(1, 13)], dtype=np.float32
+)
+
+# facteurs hebdomadaires par type: (jour ouvrable, week-end), (1.0, 1.0) par défaut
+_DAY_FACTORS = {
+    'residential': (1.0, 1.2),  # plus de consommation week-end / utilisation clim
+    'office': (1.0, 0.4),  # bureaux/commerces fermés
+    'commercial': (1.0, 0.4),
+    'school': (1.0, 0.05),  # fermée week-end
+    'industrial': (1.0, 0.7)  # Production réduite week-end
+}
+
+# mêmes facteurs indexés par code de type (dernière ligne: types inconnus)
+_DAY_FACTORS_LUT = np.array(
+    [_DAY_FACTORS.get(t, (1.0, 1.0)) for t in _BUILDING_TYPES] + [(1.0, 1.0)], dtype=np.float32
+)
+
+
+def _hourly_factor_rule(hour: int, building_type: str) -> float:
+    """
+    Facteurs horaires selon le climat tropical Malaysia
+    
+    PATTERNS CLIMATIQUES TROPICAUX:
+    - 6h-8h : Pic matinal (avant la chaleur)
+    - 11h-16h : Maximum de climatisation (heures les plus chaudes)
+    - 17h-21h : Activité élevée (après-midi/soirée)
+    - 22h-5h : Consommation nocturne réduite
+    
+    Règle de référence: évaluée une seule fois par (type, heure) pour remplir _HOURLY_FACTORS.
+    """
+    # Facteurs nocturnes par type / beaucoup plus variable avec maison et commerces
+    night_factor = _NIGHT_FACTORS.get(building_type, 0.3)
+    
+    if building_type == 'residential':
+        if 6 <= hour <= 8:  # pic matinal (avant chaleur)
+            return 1.4
+        elif 11 <= hour <= 16:  # maximum climatisation
+            return 2.0
+        elif 17 <= hour <= 21:  # Activité élevée soirée
+            return 1.6
+        elif 22 <= hour <= 23 or 0 <= hour <= 5:  # nuit de 22h à 5h du mat
+            return night_factor  # 0.3
+        else:
+            return 1.0
+    
+    elif building_type == 'commercial':
+        if 9 <= hour <= 21:  # heures d'ouverture
+            if 11 <= hour <= 16:  # pic climatisation
+                return 2.5
+            else:
+                return 1.8
+        else:  # fermé
+            return night_factor  # 0.2
+    
+    elif building_type == 'office':
+        if 8 <= hour <= 18:  # heures de bureau
+            if 11 <= hour <= 16:  # pic clim
+                return 3.0 
+            else:
+                return 2.0
+        else:  # fermé
+            return night_factor  # 0.1
+    
+    elif building_type == 'school':
+        if 7 <= hour <= 15:  # heures scolaires
+            if 11 <= hour <= 14:  # pic climatisation
+                return 5.0
+            else:
+                return 3.0
+        else:  # ecole fermée
+            return night_factor  # 0.05
+    
+    elif building_type == 'hospital':
+        if 11 <= hour <= 16:  # ic climatisation
+            return 1.8  # Vers peak (70.0 kWh)
+        elif 6 <= hour <= 22:  # activité en journée
+            return 1.4
+        else:  # nuit
+            return night_factor # 0.8
+    
+    elif building_type == 'industrial':
+        if 11 <= hour <= 16:  # pic climatisation
+            return 2.0
+        elif 6 <= hour <= 22:  # heures de production
+            return 1.5
+        else:  # Nuit
+            return night_factor  # 0.7
+    
+    elif building_type in ['hotel', 'public']:
+        if building_type == 'hotel':
+            if 11 <= hour <= 16:  # pic climatisation
+                return 1.8 
+            elif 6 <= hour <= 23:  # activité hôtelière
+                return 1.3
+            else:
+                return night_factor  # 0.6
+        else:  # public
+            if 8 <= hour <= 17:  # heures d'ouverture
+                if 11 <= hour <= 16:
+                    return 3.0
+                else:
+                    return 2.0
+            else:
+                return night_factor  # 0.1
+    
+    return 1.0
+
+
+# facteurs horaires [code du type, heure] évalués une fois à l'import (dernière ligne: types inconnus)
+_HOURLY_FACTORS = np.array(
+    [[_hourly_factor_rule(hour, building_type) for hour in range(24)] for building_type in _BUILDING_TYPES + ['']]
+)
+
+# mois de Ramadan (approximatif: Mars-Avril) en table booléenne indexée par mois
+_RAMADAN_MONTHS = np.zeros(13, dtype=bool)
+_RAMADAN_MONTHS[[3, 4]] = True
+
+# codes des types concernés par le Ramadan et la prière du vendredi
+_RAMADAN_TYPE_CODES = frozenset(_BUILDING_TYPES.index(t) for t in ('residential', 'commercial'))
+_FRIDAY_TYPE_CODES = frozenset(_BUILDING_TYPES.index(t) for t in ('office', 'commercial'))
+
+# paquets par processus en génération parallèle (un processus libéré reprend un paquet)
+_CHUNKS_PER_WORKER = 4
+
+# en dessous de ce nombre de bâtiments, lancer des processus coûte plus que la génération
+_MIN_BUILDINGS_FOR_PROCESSES = 256
+
+# attributs lus sur les objets Building (nom de colonne d'entrée, attribut)
+_BUILDING_ATTRIBUTES = (
+    ('id', 'building_id'),
+    ('building_type', 'building_type'),
+    ('surface_area_m2', 'surface_area_m2'),
+    ('latitude', 'latitude'),
+    ('longitude', 'longitude'),
+    ('zone_name', 'zone_name')
+)
+
+# attributs Building repris dans les métadonnées (nom de colonne, attribut)
+_METADATA_ATTRIBUTES = (
+    ('building_id', 'building_id'),
+    ('osm_id', 'osm_id'),
+    ('zone_name', 'zone_name'),
+    ('building_type', 'building_type'),
+    ('latitude', 'latitude'),
+    ('longitude', 'longitude'),
+    ('surface_area_m2', 'surface_area_m2'),
+    ('base_consumption_kwh', 'base_consumption_kwh')
+)
+
+# catégorie de chaque type (clés en minuscules), types absents → 'Autre'
+_CATEGORY_MAP = {
+    'residential': 'Résidentiel',
+    'commercial': 'Commercial',
+    'hotel': 'Commercial',
+    'office': 'Bureaux',
+    'industrial': 'Industriel',
+    'hospital': 'Institutionnel',
+    'school': 'Institutionnel',
+    'public': 'Institutionnel',
+    'religious': 'Institutionnel'
+}
+
+# types compacts des colonnes de sortie (float32 suffit vu le bruit de 5%, chaînes répétées en catégories)
+_OUTPUT_DTYPES = {
+    'consumption_kwh': 'float32',
+    'building_id': 'category',
+    'building_type': 'category',
+    'zone_name': 'category',
+    'latitude': 'float32',
+    'longitude': 'float32'
+}
+
+
+def _building_type_codes(building_types: np.ndarray) -> np.ndarray:
+    """
+    Code entier de chaque type de bâtiment (indice dans _BUILDING_TYPES)
+    
+    Calculé une fois par génération; les tables de facteurs sont indexées par ce code.
+    Les types inconnus reçoivent _UNKNOWN_TYPE_CODE.
+    """
+    type_codes = pd.Categorical(building_types, categories=_BUILDING_TYPES).codes
+    return np.where(type_codes < 0, _UNKNOWN_TYPE_CODE, type_codes).astype(np.int8)
+
+
+@functools.lru_cache(maxsize=8)
+def _time_features(
+    start_date: str, 
+    end_date: str, 
+    frequency: str
+) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Décompose la période une seule fois par (début, fin, fréquence)
+    
+    Les appels répétés sur la même fenêtre réutilisent l'index et ses composantes
+    calendaires (tableaux en lecture seule, partagés entre les appels).
+    
+    Returns:
+        Tuple: (date_range, hours, weekdays, months, interval_hours)
+    """
+    date_range = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    
+    # durée de l'intervalle (constante pour toute la génération)
+    if len(date_range) >= 2:
+        interval_hours = (date_range[1] - date_range[0]).total_seconds() / 3600
+    else:
+        interval_hours = 1.0
+    
+    # composantes calendaires (tableaux int8) par arithmétique sur l'epoch int64,
+    # sans passer par les accesseurs datetime de l'index
+    epoch_s = date_range.asi8 // 10**9
+    days = epoch_s // 86400
+    hours = ((epoch_s // 3600) % 24).astype(np.int8)
+    weekdays = ((days + 3) % 7).astype(np.int8)  # 1er janvier 1970 = jeudi (3)
+    months = date_range.month.to_numpy().astype(np.int8)
+    
+    for values in (hours, weekdays, months):
+        values.flags.writeable = False
+    
+    return date_range, hours, weekdays, months, interval_hours
+
+
+@functools.lru_cache(maxsize=64)
+def _cultural_factors(
+    start_date: str, 
+    end_date: str, 
+    frequency: str, 
+    type_code: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Facteurs Ramadan et prière du vendredi de chaque point, par code de type
+    
+    Ramadan (Mars-Avril approximatif): jeûne 4h-17h, activités nocturnes 18h-23h;
+    vendredi 12h-15h: prière. Mis en cache avec la décomposition de la période.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (facteurs ramadan, facteurs vendredi)
+    """
+    _, hours, weekdays, months, _ = _time_features(start_date, end_date, frequency)
+    
+    # ramadan approximatif en Mars-Avril: jeûne 4h-17h, activités nocturnes 18h-23h
+    ramadan_factors = np.ones(len(hours), dtype=np.float32)
+    if type_code in _RAMADAN_TYPE_CODES:
+        ramadan_month = _RAMADAN_MONTHS[months]
+        ramadan_factors[ramadan_month & (hours >= 4) & (hours <= 17)] = 0.6
+        ramadan_factors[ramadan_month & (hours >= 18)] = 1.4
+    
+    # vendredi 12h-15h: réduction pour la prière
+    friday_factors = np.ones(len(hours), dtype=np.float32)
+    if type_code in _FRIDAY_TYPE_CODES:
+        friday_factors[(weekdays == 4) & (hours >= 12) & (hours <= 15)] = 0.6
+    
+    for values in (ramadan_factors, friday_factors):
+        values.flags.writeable = False
+    
+    return ramadan_factors, friday_factors
+
+
+@functools.lru_cache(maxsize=64)
+def _daily_factors(
+    start_date: str, 
+    end_date: str, 
+    frequency: str, 
+    type_code: int
+) -> np.ndarray:
+    """
+    Facteurs hebdomadaires de chaque point pour un code de type
+    
+    Masque week-end calculé une fois,
+    deux valeurs par type (ligne de _DAY_FACTORS_LUT) appliquées avec np.where.
+    
+    Returns:
+        np.ndarray: facteur jour ouvrable / week-end de chaque point
+    """
+    _, _, weekdays, _, _ = _time_features(start_date, end_date, frequency)
+    
+    weekday_factor, weekend_factor = _DAY_FACTORS_LUT[type_code]
+    weekend_mask = weekdays >= 5  # Samedi-Dimanche
+    
+    day_factors = np.where(weekend_mask, weekend_factor, weekday_factor).astype(np.float32)
+    day_factors.flags.writeable = False
+    
+    return day_factors
+
+
+@functools.lru_cache(maxsize=8)
+def _type_factor_tables(
+    start_date: str, 
+    end_date: str, 
+    frequency: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Facteurs jour / Ramadan / vendredi de tous les types, empilés par code de type
+    
+    Returns:
+        Tuple: tables (codes de type, points temporels) des facteurs hebdomadaires,
+               Ramadan et vendredi (ligne = code du type, dernière ligne = inconnu)
+    """
+    type_codes = range(_UNKNOWN_TYPE_CODE + 1)
+    cultural = [_cultural_factors(start_date, end_date, frequency, code) for code in type_codes]
+    
+    tables = (
+        np.stack([_daily_factors(start_date, end_date, frequency, code) for code in type_codes]),
+        np.stack([ramadan for ramadan, _ in cultural]),
+        np.stack([friday for _, friday in cultural])
+    )
+    for table in tables:
+        table.flags.writeable = False
+    
+    return tables
+
+
+@functools.lru_cache(maxsize=8)
+def _combined_factor_table(
+    start_date: str, 
+    end_date: str, 
+    frequency: str
+) -> np.ndarray:
+    """
+    Produit de tous les facteurs temporels, par code de type et par point
+    
+    heure × jour × saison × ramadan × vendredi ne dépend que de (type, instant):
+    calculé une fois par période, le noyau n'a plus qu'une multiplication
+    (base × facteur combiné × hasard) par point.
+    
+    Returns:
+        np.ndarray: table float32 (codes de type, points temporels), dernière ligne = inconnu
+    """
+    _, hours, _, months, _ = _time_features(start_date, end_date, frequency)
+    day_table, ramadan_table, friday_table = _type_factor_tables(start_date, end_date, frequency)
+    
+    combined = (_HOURLY_FACTORS[:, hours] * # 1/ pattern tropical
+                day_table * # 2/ pattern hebdomadaire
+                _SEASONAL_LUT[months] * # 3/ pattern saisonnier
+                ramadan_table * # 4/ pattern ramadan
+                friday_table).astype(np.float32) # 5/ pattern vendredi
+    combined.flags.writeable = False
+    
+    return combined
+
+
+def _chunk_kernel_numpy(
+    base_scaled: np.ndarray,
+    type_codes: np.ndarray,
+    factor_table: np.ndarray,
+    random_factors: np.ndarray,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Consommation de tous les bâtiments d'un paquet (version NumPy)
+    
+    Une ligne de `out` par bâtiment; la table des facteurs combinés est
+    indexée par le code du type de chaque bâtiment.
+    """
+    for j, code in enumerate(type_codes):
+        out[j] = (base_scaled[j] * # Base kWh/intervalle (specs Malaysia)
+                  factor_table[code] * # 1-5/ patterns tropical, hebdomadaire, saisonnier, ramadan, vendredi
+                  random_factors[j]) # 6/ variation
+    
+    # Limites de sécurité (minimum technique), appliquées au tableau entier
+    np.clip(out, 0.001, None, out=out)
+    
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _chunk_kernel(base_scaled, type_codes, factor_table, random_factors, out):
+        # bâtiments indépendants: répartis entre les threads (prange), une passe par ligne
+        for j in prange(base_scaled.size):
+            factors = factor_table[type_codes[j]]
+            for i in range(factors.size):
+                value = base_scaled[j] * factors[i] * random_factors[j, i]
+                out[j, i] = value if value > 0.001 else 0.001
+        return out
+else:
+    _chunk_kernel = _chunk_kernel_numpy
+
+
+def _consumption_stats_numpy(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Somme, somme et somme des carrés des écarts au premier point, minimum et maximum (version NumPy)
+    
+    Les écarts au premier point évitent l'annulation numérique dans le calcul de la variance.
+    """
+    deviations = values.astype(np.float64) - values[0]
+    return (
+        float(values.sum(dtype=np.float64)), float(deviations.sum()), float(np.dot(deviations, deviations)),
+        float(values.min()), float(values.max())
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _consumption_stats(values):
+        # mêmes statistiques que _consumption_stats_numpy en une seule passe sur les données
+        shift = np.float64(values[0])
+        total = 0.0
+        shifted = 0.0
+        shifted_squares = 0.0
+        low = values[0]
+        high = values[0]
+        for i in range(values.size):
+            value = values[i]
+            deviation = value - shift
+            total += value
+            shifted += deviation
+            shifted_squares += deviation * deviation
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        return total, shifted, shifted_squares, float(low), float(high)
+else:
+    _consumption_stats = _consumption_stats_numpy
+
 
 class ElectricityDataGenerator:
     """
@@ -60,14 +545,22 @@ class ElectricityDataGenerator:
     selon les spécifications climatiques et culturelles Malaysia.
     """
     
-    def __init__(self):
-        """Initialise le générateur avec les statistiques"""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialise le générateur avec les statistiques
+        
+        Args:
+            seed: graine du générateur aléatoire (GEN_CONFIG.SEED par défaut, None = non reproductible)
+        """
         self.generation_stats = {
             'total_buildings_generated': 0,
             'total_timeseries_generated': 0,
             'generation_start_time': datetime.now()
         }
         
+        # générateur aléatoire PCG64 (tirages vectorisés, plus rapide que np.random.*)
+        self._rng = np.random.default_rng(GEN_CONFIG.SEED if seed is None else seed)
+        
         logger.info("générateur électrique Malaysia initialisé")
     
     def generate_timeseries_data(
@@ -75,59 +568,189 @@ class ElectricityDataGenerator:
         buildings: List[Dict], 
         start_date: str, 
         end_date: str, 
-        frequency: str = '1H'
+        frequency: str = '1H',
+        output_path: Optional[str] = None,
+        chunk_buildings: int = 1000,
+        n_jobs: int = 1
     ) -> Dict:
         """
         Génère des données de consommation électrique pour les bâtiments
         
+        Conserve l'API historique (liste de dictionnaires OSM): les bâtiments sont
+        convertis une fois en DataFrame puis confiés à generate_timeseries_data_df.
+        
         Args:
             buildings: liste des bâtiments OSM
             start_date: date de début (YYYY-MM-DD)
             end_date: date de fin (YYYY-MM-DD) 
             frequency: fréquence d'échantillonnage ('15T', '30T', '1H', '3H', 'D')
+            output_path: fichier Parquet de sortie (optionnel, écriture en flux)
+            chunk_buildings: nombre de bâtiments par paquet
+            n_jobs: nombre de threads numba, ou de processus sans numba (1 = séquentiel, -1 = tous les coeurs)
+            
+        Returns:
+            Dict: résultat avec données générées et métadonnées
+                  ('data' vaut None quand les données sont écrites dans output_path)
+        """
+        try:
+            buildings_df = pd.DataFrame(buildings)
+        except Exception as e:
+            logger.error("Erreur génération: %s", e)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        
+        return self.generate_timeseries_data_df(
+            buildings_df, start_date, end_date, frequency,
+            output_path=output_path, chunk_buildings=chunk_buildings, n_jobs=n_jobs
+        )
+    
+    def generate_timeseries_data_df(
+        self, 
+        buildings_df: pd.DataFrame, 
+        start_date: str, 
+        end_date: str, 
+        frequency: str = '1H',
+        output_path: Optional[str] = None,
+        chunk_buildings: int = 1000,
+        n_jobs: int = 1
+    ) -> Dict:
+        """
+        Génère des données de consommation électrique à partir d'un DataFrame de bâtiments
+        
+        Les attributs des bâtiments sont lus en colonnes (tableaux NumPy) et la
+        consommation de base est calculée en une seule opération vectorisée.
+        Les bâtiments sont traités par paquets de `chunk_buildings`: chaque paquet
+        est assemblé en un DataFrame puis, si `output_path` est fourni, écrit
+        directement dans un fichier Parquet (mémoire bornée à un paquet).
+        Les séries des bâtiments étant indépendantes, les paquets peuvent être
+        générés en parallèle (`n_jobs`): sur plusieurs threads par le noyau numba
+        quand il est disponible, sinon dans plusieurs processus.
+        
+        Args:
+            buildings_df: bâtiments (colonnes id, building_type, surface_area_m2,
+                          latitude, longitude, zone_name)
+            start_date: date de début (YYYY-MM-DD)
+            end_date: date de fin (YYYY-MM-DD) 
+            frequency: fréquence d'échantillonnage ('15T', '30T', '1H', '3H', 'D')
+            output_path: fichier Parquet de sortie (optionnel, écriture en flux)
+            chunk_buildings: nombre de bâtiments par paquet
+            n_jobs: nombre de threads numba, ou de processus sans numba (1 = séquentiel, -1 = tous les coeurs)
             
         Returns:
             Dict: résultat avec données générées et métadonnées
+                  ('data' vaut None quand les données sont écrites dans output_path)
         """
         start_time = datetime.now()
+        num_buildings = len(buildings_df)
         
         try:
-            logger.info(f"génération données électriques pour {len(buildings)} bâtiments")
-            logger.info(f"Période: {start_date} → {end_date} (fréquence: {frequency})")
+            logger.info("génération données électriques pour %d bâtiments", num_buildings)
+            logger.info("Période: %s → %s (fréquence: %s)", start_date, end_date, frequency)
+            
+            # index temporel et composantes calendaires (mis en cache par période)
+            date_range = _time_features(start_date, end_date, frequency)[0]
+            logger.info("%d points temporels à générer", len(date_range))
             
-            # créer l'index temporel
-            date_range = pd.date_range(start=start_date, end=end_date, freq=frequency)
-            logger.info(f"{len(date_range)} points temporels à générer")
+            # attributs des bâtiments en colonnes + consommation de base vectorisée
+            building_columns = self._prepare_building_columns(buildings_df)
             
-            # générer les données pour chaque bâtiment
-            all_data = []
+            # découpage en paquets (plusieurs paquets par processus pour équilibrer la charge)
+            workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+            use_processes = (workers > 1 and not NUMBA_AVAILABLE
+                             and num_buildings >= _MIN_BUILDINGS_FOR_PROCESSES)
+            target_chunks = workers * _CHUNKS_PER_WORKER if use_processes else 1
+            chunk_size = max(1, min(chunk_buildings, -(-num_buildings // target_chunks)))
+            building_chunks = [
+                building_columns.iloc[k:k + chunk_size] for k in range(0, num_buildings, chunk_size)
+            ]
             
-            for i, building in enumerate(buildings):
-                if i % 10000 == 0 and i > 0:
-                    logger.info(f"progression: {i}/{len(buildings)} bâtiments traités")
+            # générer les données par paquets de bâtiments
+            chunks = []
+            writer = None
+            executor = None
+            previous_threads = None
+            total_points = 0
+            processed = 0
+            
+            try:
+                if use_processes and len(building_chunks) > 1:
+                    # paquets indépendants: un processus par paquet, une graine par paquet
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    seeds = self._rng.integers(0, 2**32, size=len(building_chunks))
+                    chunk_results = executor.map(
+                        _generate_chunk_worker,
+                        building_chunks,
+                        repeat(start_date),
+                        repeat(end_date),
+                        repeat(frequency),
+                        seeds
+                    )
+                else:
+                    # avec numba, les bâtiments de chaque paquet sont répartis sur `workers` threads
+                    # (réglage propre au thread appelant, rétabli en sortie)
+                    if NUMBA_AVAILABLE:
+                        previous_threads = get_num_threads()
+                        set_num_threads(min(workers, numba_config.NUMBA_NUM_THREADS))
+                    
+                    chunk_results = (
+                        self._generate_chunk(chunk, start_date, end_date, frequency)
+                        for chunk in building_chunks
+                    )
                 
-                building_data = self._generate_building_timeseries(building, date_range)
-                all_data.extend(building_data)
+                for chunk, chunk_columns in zip(building_chunks, chunk_results):
+                    total_points += len(chunk_columns['consumption_kwh'])
+                    
+                    # horodatages non renvoyés par les processus: reconstruits depuis l'index local
+                    if chunk_columns['timestamp'] is None:
+                        chunk_columns['timestamp'] = np.tile(date_range.values, len(chunk))
+                    
+                    if output_path:
+                        # écriture en flux depuis les tableaux NumPy: un row group par paquet
+                        table = _columns_to_arrow(chunk_columns)
+                        if writer is None:
+                            writer = pq.ParquetWriter(output_path, table.schema, compression='snappy')
+                        writer.write_table(table)
+                    else:
+                        chunks.append(chunk_columns)
+                    
+                    processed += len(chunk)
+                    if processed // 10000 > (processed - len(chunk)) // 10000 and processed < num_buildings:
+                        logger.info("progression: %d/%d bâtiments traités", processed, num_buildings)
+            finally:
+                if previous_threads is not None:
+                    set_num_threads(previous_threads)
+                if executor is not None:
+                    executor.shutdown()
+                if writer is not None:
+                    writer.close()
             
             # creation DataFrame final
-            df = pd.DataFrame(all_data)
+            if output_path:
+                df = None
+            elif chunks:
+                df = pd.DataFrame(_concat_columns(chunks), copy=False).astype(_OUTPUT_DTYPES)
+            else:
+                df = pd.DataFrame()
             
             # métadonnées de génération
             generation_time = (datetime.now() - start_time).total_seconds()
             
             # mise à jour des statistiques
-            self.generation_stats['total_buildings_generated'] += len(buildings)
-            self.generation_stats['total_timeseries_generated'] += len(all_data)
+            self.generation_stats['total_buildings_generated'] += num_buildings
+            self.generation_stats['total_timeseries_generated'] += total_points
             
-            logger.info(f"génération terminée en {generation_time:.1f}s")
-            logger.info(f"{len(all_data)} points de données générés")
+            logger.info("génération terminée en %.1fs", generation_time)
+            logger.info("%d points de données générés", total_points)
             
             return {
                 'success': True,
                 'data': df,
                 'metadata': {
-                    'total_points': len(all_data),
-                    'buildings_count': len(buildings),
+                    'total_points': total_points,
+                    'buildings_count': num_buildings,
+                    'output_path': output_path,
                     'date_range': {
                         'start': start_date,
                         'end': end_date,
@@ -142,312 +765,349 @@ class ElectricityDataGenerator:
             }
             
         except Exception as e:
-            logger.error(f"Erreur génération: {str(e)}")
+            logger.error("Erreur génération: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
     
-    def _estimate_base_consumption(self, building_type: str, surface_area: float) -> float:
-        
-        #fonction qui estime la consommation de base selon des spécifications définies pour la Malaysie
+    def generate_timeseries_for_buildings(
+        self, 
+        buildings: List, 
+        start_date: str, 
+        end_date: str, 
+        frequency: str = '1H',
+        chunk_buildings: int = 1000,
+        n_jobs: int = 1
+    ) -> pd.DataFrame:
+        """
+        Génère les séries temporelles d'une liste d'objets Building
         
-        #base / pic / facteur nuit
-
+        Les attributs sont extraits en une seule passe (attrgetter sur tous les
+        champs à la fois) puis transposés en colonnes NumPy, sans lecture
+        attribut par attribut pour chaque bâtiment.
         
-        # spécifications
-        specs = {
-            'residential': {'base': 0.5, 'peak': 12.0, 'night': 0.3},
-            'commercial': {'base': 5.0, 'peak': 80.0, 'night': 0.2},
-            'industrial': {'base': 20.0, 'peak': 200.0, 'night': 0.7},
-            'office': {'base': 3.0, 'peak': 45.0, 'night': 0.1},
-            'hospital': {'base': 25.0, 'peak': 70.0, 'night': 0.8},
-            'school': {'base': 1.0, 'peak': 25.0, 'night': 0.05},
-            'hotel': {'base': 8.0, 'peak': 40.0, 'night': 0.6},
-            'public': {'base': 3.0, 'peak': 45.0, 'night': 0.1},
-            'religious': {'base': 1.0, 'peak': 15.0, 'night': 0.05}
-        }
-        
-        building_spec = specs.get(building_type, specs['residential'])
-        base_unit_consumption = building_spec['base']  # kWh/heure pour 100m²
+        Args:
+            buildings: objets Building (ou tout objet exposant les mêmes attributs)
+            start_date: date de début (YYYY-MM-DD)
+            end_date: date de fin (YYYY-MM-DD)
+            frequency: fréquence d'échantillonnage
+            chunk_buildings: nombre de bâtiments par paquet
+            n_jobs: nombre de threads numba, ou de processus sans numba (1 = séquentiel, -1 = tous les coeurs)
+            
+        Returns:
+            pd.DataFrame: séries temporelles générées
+        """
+        names = [name for name, _ in _BUILDING_ATTRIBUTES]
+        getter = operator.attrgetter(*(attribute for _, attribute in _BUILDING_ATTRIBUTES))
+        rows = list(map(getter, buildings))
         
-        # Facteur de surface (référence 100m²)
-        surface_factor = surface_area / 100.0
-        surface_factor = max(0.1, min(surface_factor, 10.0))  # Limiter 10m² à 1000m²
+        buildings_df = pd.DataFrame(
+            {name: np.array(values) for name, values in zip(names, zip(*rows))} if rows else None,
+            columns=names
+        )
         
-        # Consommation de base finale (kWh/heure)
-        base_consumption = base_unit_consumption * surface_factor
+        result = self.generate_timeseries_data_df(
+            buildings_df, start_date, end_date, frequency,
+            chunk_buildings=chunk_buildings, n_jobs=n_jobs
+        )
+        if not result['success']:
+            raise RuntimeError(result['error'])
         
-        return max(0.1, min(base_consumption, 500.0))  # limites de sécurité
+        return result['data']
     
-    def _get_hourly_factor(self, hour: int, building_type: str) -> float:
+    def generate_building_metadata(self, buildings: List) -> pd.DataFrame:
         """
-        Facteurs horaires selon le climat tropical Malaysia
+        Construit la table des métadonnées d'une liste d'objets Building
+        
+        Les attributs sont extraits en une passe (attrgetter), la catégorie est
+        obtenue par correspondance sur les catégories du type (une recherche par
+        type distinct, pas par bâtiment).
         
-        PATTERNS CLIMATIQUES TROPICAUX:
-        - 6h-8h : Pic matinal (avant la chaleur)
-        - 11h-16h : Maximum de climatisation (heures les plus chaudes)
-        - 17h-21h : Activité élevée (après-midi/soirée)
-        - 22h-5h : Consommation nocturne réduite
+        Args:
+            buildings: objets Building
+            
+        Returns:
+            pd.DataFrame: une ligne par bâtiment, avec la colonne building_category
         """
-        # Facteurs nocturnes par type / beaucoup plus variable avec maison et commerces
-        night_factors = {
-            'residential': 0.3, 'commercial': 0.2, 'industrial': 0.7,
-            'office': 0.1, 'hospital': 0.8, 'school': 0.05,
-            'hotel': 0.6, 'public': 0.1, 'religious': 0.05
-        }
+        names = [name for name, _ in _METADATA_ATTRIBUTES]
+        getter = operator.attrgetter(*(attribute for _, attribute in _METADATA_ATTRIBUTES))
+        rows = list(map(getter, buildings))
         
-        night_factor = night_factors.get(building_type, 0.3)
+        metadata = pd.DataFrame(
+            {name: np.array(values) for name, values in zip(names, zip(*rows))} if rows else None,
+            columns=names
+        )
         
-        if building_type == 'residential':
-            if 6 <= hour <= 8:  # pic matinal (avant chaleur)
-                return 1.4
-            elif 11 <= hour <= 16:  # maximum climatisation
-                return 2.0
-            elif 17 <= hour <= 21:  # Activité élevée soirée
-                return 1.6
-            elif 22 <= hour <= 23 or 0 <= hour <= 5:  # nuit de 22h à 5h du mat
-                return night_factor  # 0.3
-            else:
-                return 1.0
-                
-        elif building_type == 'commercial':
-            if 9 <= hour <= 21:  # heures d'ouverture
-                if 11 <= hour <= 16:  # pic climatisation
-                    return 2.5
-                else:
-                    return 1.8
-            else:  # fermé
-                return night_factor  # 0.2
-                
-        elif building_type == 'office':
-            if 8 <= hour <= 18:  # heures de bureau
-                if 11 <= hour <= 16:  # pic clim
-                    return 3.0 
-                else:
-                    return 2.0
-            else:  # fermé
-                return night_factor  # 0.1
-                
-        elif building_type == 'school':
-            if 7 <= hour <= 15:  # heures scolaires
-                if 11 <= hour <= 14:  # pic climatisation
-                    return 5.0
-                else:
-                    return 3.0
-            else:  # ecole fermée
-                return night_factor  # 0.05
-                
-        elif building_type == 'hospital':
-            if 11 <= hour <= 16:  # ic climatisation
-                return 1.8  # Vers peak (70.0 kWh)
-            elif 6 <= hour <= 22:  # activité en journée
-                return 1.4
-            else:  # nuit
-                return night_factor # 0.8
-                
-        elif building_type == 'industrial':
-            if 11 <= hour <= 16:  # pic climatisation
-                return 2.0
-            elif 6 <= hour <= 22:  # heures de production
-                return 1.5
-            else:  # Nuit
-                return night_factor  # 0.7
-                
-        elif building_type in ['hotel', 'public']:
-            if building_type == 'hotel':
-                if 11 <= hour <= 16:  # pic climatisation
-                    return 1.8 
-                elif 6 <= hour <= 23:  # activité hôtelière
-                    return 1.3
-                else:
-                    return night_factor  # 0.6
-            else:  # public
-                if 8 <= hour <= 17:  # heures d'ouverture
-                    if 11 <= hour <= 16:
-                        return 3.0
-                    else:
-                        return 2.0
-                else:
-                    return night_factor  # 0.1
+        metadata['zone_name'] = metadata['zone_name'].astype('category')
+        metadata['building_type'] = metadata['building_type'].astype('category')
+        metadata['building_category'] = (
+            metadata['building_type'].str.lower().map(_CATEGORY_MAP).fillna('Autre').astype('category')
+        )
         
-        return 1.0
+        return metadata
     
-    def _get_seasonal_factor(self, month: int) -> float:
+    def generate_timeseries_batches(
+        self, 
+        buildings_df: pd.DataFrame, 
+        start_date: str, 
+        end_date: str, 
+        frequency: str = '1H',
+        batch_buildings: int = 256
+    ) -> Iterator[pa.RecordBatch]:
         """
-        Facteurs saisonniers Malaysia selon le document officiel
+        Génère les données de consommation en flux de RecordBatch Arrow
         
-        FACTEURS SAISONNIERS:
-        - Nov-Fév: Mousson NE (0.9-1.1×) - Moins de climatisation
-        - Mar-Avr: Transition (1.2-1.5×) - Période chaude + Ramadan
-        - Mai-Août: Saison sèche (1.3-1.7×) - Maximum de climatisation
-        - Sep-Oct: Variable (1.0-1.3×) - Climat changeant
-        """
-        seasonal_factors = {
-            # Mousson NE - Moins de climatisation
-            11: 0.95, 12: 0.9, 1: 0.9, 2: 1.0,
-            
-            # Transition - Période chaude + Ramadan
-            3: 1.3, 4: 1.4,
-            
-            # Saison sèche - Maximum de climatisation
-            5: 1.5, 6: 1.6, 7: 1.7, 8: 1.6,
+        Un lot est produit par paquet de `batch_buildings` bâtiments: la mémoire
+        occupée est bornée à un paquet (bâtiments × points temporels) au lieu de
+        l'ensemble des données, et les lots peuvent être consommés directement par
+        un ParquetWriter ou tout autre système Arrow (colonnes de chaînes encodées
+        en dictionnaire, mêmes catégories pour tous les lots).
+        
+        Args:
+            buildings_df: bâtiments (mêmes colonnes que generate_timeseries_data_df)
+            start_date: date de début (YYYY-MM-DD)
+            end_date: date de fin (YYYY-MM-DD)
+            frequency: fréquence d'échantillonnage
+            batch_buildings: nombre de bâtiments par lot
             
-            # Variable - Climat changeant
-            9: 1.2, 10: 1.1
-        }
+        Returns:
+            Iterator[pa.RecordBatch]: lots successifs de données générées
+        """
+        building_columns = self._prepare_building_columns(buildings_df)
+        num_buildings = len(building_columns)
+        batch_buildings = max(1, batch_buildings)
         
-        return seasonal_factors.get(month, 1.0)
+        for k in range(0, num_buildings, batch_buildings):
+            chunk = building_columns.iloc[k:k + batch_buildings]
+            chunk_columns = self._generate_chunk(chunk, start_date, end_date, frequency)
+            yield from _columns_to_arrow(chunk_columns).to_batches()
+            
+            self.generation_stats['total_buildings_generated'] += len(chunk)
+            self.generation_stats['total_timeseries_generated'] += len(chunk_columns['consumption_kwh'])
     
-    def _get_daily_factor(self, weekday: int, building_type: str) -> float:
+    def generate_timeseries_dask(
+        self, 
+        buildings, 
+        start_date: str, 
+        end_date: str, 
+        frequency: str = '1H',
+        npartitions: Optional[int] = None,
+        output_dir: Optional[str] = None
+    ):
         """
-        Facteurs hebdomadaires Malaysia
+        Génère les données de consommation partition par partition avec Dask
         
-        PATTERNS HEBDOMADAIRES:
-        - Vendredi après-midi : Réduction d'activité (prière du vendredi)
-        - Weekend : Plus de consommation résidentielle
-        - Jours ouvrables : Pics dans les bureaux/commerces
+        Pour les très gros volumes (millions de bâtiments): chaque partition de
+        bâtiments est générée indépendamment par le noyau vectorisé (aucun échange
+        entre partitions, les bâtiments étant indépendants), avec sa propre graine
+        dérivée de celle du générateur. Le calcul reste paresseux jusqu'à l'écriture
+        ou au compute() de l'appelant.
         
         Args:
-            weekday: 0=Lundi, 4=Vendredi, 5=Samedi, 6=Dimanche
-        """
-        is_weekend = weekday >= 5  # Samedi-Dimanche
-        
-        if building_type == 'residential':
-            return 1.2 if is_weekend else 1.0  # plus de consommation week-end / utilisation clim 
-            
-        elif building_type in ['office', 'commercial']:
-            if is_weekend:
-                return 0.4  # bureaux/commerces fermés
-            else:
-                return 1.0
-                
-        elif building_type == 'school':
-            return 0.05 if is_weekend else 1.0  # fermée week-end ?
-            
-        elif building_type in ['hospital', 'hotel']:
-            return 1.0  # pas d'impact sur ces secteurs 
+            buildings: bâtiments, liste de dictionnaires, DataFrame pandas ou dask
+                       (mêmes colonnes que generate_timeseries_data_df)
+            start_date: date de début (YYYY-MM-DD)
+            end_date: date de fin (YYYY-MM-DD)
+            frequency: fréquence d'échantillonnage
+            npartitions: nombre de partitions d'un DataFrame pandas (4 par cœur par défaut)
+            output_dir: répertoire Parquet de sortie, partitionné par building_type
             
-        elif building_type == 'industrial':
-            return 0.7 if is_weekend else 1.0  # Production réduite week-end
+        Returns:
+            DataFrame dask paresseux des séries générées, ou None si écrit dans output_dir
             
-        else:
-            return 1.0
-    
-    def _get_ramadan_factor(self, month: int, hour: int, building_type: str) -> float:
+        Raises:
+            ImportError: si dask n'est pas installé
         """
-        Facteurs Ramadan Malaysia (Mar-Avr approximatif)
+        if not DASK_AVAILABLE:
+            raise ImportError("dask requis pour la génération par partitions: pip install 'dask[dataframe]'")
+        
+        if isinstance(buildings, list):
+            buildings = pd.DataFrame(buildings)
+        if isinstance(buildings, pd.DataFrame):
+            buildings = dd.from_pandas(buildings, npartitions=npartitions or (os.cpu_count() or 1) * 4)
+        
+        timeseries = buildings.map_partitions(
+            _generate_partition,
+            start_date,
+            end_date,
+            frequency,
+            int(self._rng.integers(0, 2**32)),
+            # catégories inconnues: chaque partition a ses propres catégories
+            meta=clear_known_categories(_empty_timeseries_frame())
+        )
+        
+        if output_dir:
+            timeseries.to_parquet(output_dir, partition_on=['building_type'])
+            logger.info("génération par partitions écrite dans %s", output_dir)
+            return None
         
-        attention le ramadan est variable selon les années
-        PÉRIODE DE RAMADAN:
-        - 4h-17h : Consommation réduite de 40% (jeûne)
-        - 18h-23h : Consommation augmentée de 40% (Iftar, activités nocturnes)
+        return timeseries
+    
+    def _prepare_building_columns(self, buildings_df: pd.DataFrame) -> pd.DataFrame:
         """
-        # ramadan approximatif en Mars-Avril / pas forcement réel
-        if month not in [3, 4]:
-            return 1.0
+        Extrait les attributs des bâtiments en colonnes et calcule leur consommation de base
+        
+        Args:
+            buildings_df: bâtiments (colonnes id, building_type, surface_area_m2,
+                          latitude, longitude, zone_name)
             
-        if building_type in ['residential', 'commercial']:
-            if 4 <= hour <= 17:  # Période de jeûne
-                return 0.6  # Réduction de 40% / permet de voir un variance période ramadan
-            elif 18 <= hour <= 23:  # activités nocturnes
-                return 1.4  # Augmentation de 40%
-            else:
-                return 1.0
+        Returns:
+            pd.DataFrame: une ligne par bâtiment, prête à être découpée en paquets
+        """
+        num_buildings = len(buildings_df)
+        if not num_buildings:
+            return pd.DataFrame()
+        
+        # surface manquante → 100m² (colonne complétée une fois, en float32)
+        if 'surface_area_m2' in buildings_df:
+            surface_areas = buildings_df['surface_area_m2'].fillna(100.0).to_numpy(dtype=np.float32)
         else:
-            return 1.0  # Hôpitaux, industriel moins affectés
+            surface_areas = np.full(num_buildings, 100.0, dtype=np.float32)
+        
+        # chaînes en catégories communes à tous les paquets (seuls les codes sont répétés),
+        # coordonnées en float32 avant la répétition sur chaque point
+        type_codes = _building_type_codes(buildings_df['building_type'].to_numpy())
+        return pd.DataFrame({
+            'building_id': pd.Categorical(buildings_df['id'].to_numpy()),
+            'building_type': pd.Categorical(buildings_df['building_type'].to_numpy()),
+            'type_code': type_codes,
+            'base_consumption': self._estimate_base_consumptions(type_codes, surface_areas),
+            'latitude': buildings_df['latitude'].to_numpy(dtype=np.float32),
+            'longitude': buildings_df['longitude'].to_numpy(dtype=np.float32),
+            'zone_name': pd.Categorical(buildings_df['zone_name'].to_numpy())
+        })
     
-    def _get_friday_prayer_factor(self, weekday: int, hour: int, building_type: str) -> float:
+    def _generate_chunk(
+        self, 
+        buildings_chunk: pd.DataFrame, 
+        start_date: str, 
+        end_date: str, 
+        frequency: str,
+        with_timestamps: bool = True
+    ) -> Dict[str, np.ndarray]:
         """
-        Facteur spécial pour la prière du vendredi
+        Génère les séries temporelles d'un paquet de bâtiments
         
-        VENDREDI APRÈS-MIDI:
-        - Réduction d'activité (prière du vendredi) 12h-15h
+        Args:
+            buildings_chunk: colonnes des bâtiments du paquet (dont base_consumption)
+            start_date, end_date, frequency: période (décomposition lue dans le cache)
+            with_timestamps: construire la colonne timestamp (sinon None, à compléter par l'appelant)
+            
+        Returns:
+            Dict[str, np.ndarray]: colonnes des séries du paquet (une entrée par colonne de sortie)
         """
-        if weekday == 4 and 12 <= hour <= 15:  # Vendredi 12h-15h
-            if building_type in ['office', 'commercial']:
-                return 0.6  # Réduction pour prière
-        return 1.0
+        date_range, _, _, _, interval_hours = _time_features(start_date, end_date, frequency)
+        factor_table = _combined_factor_table(start_date, end_date, frequency)
+        num_points = len(date_range)
+        building_ids = buildings_chunk['building_id'].to_numpy()
+        building_types = buildings_chunk['building_type'].to_numpy()
+        type_codes = buildings_chunk['type_code'].to_numpy()
+        base_consumptions = buildings_chunk['base_consumption'].to_numpy()
+        
+        # variation aléatoire: un seul tirage pour tout le paquet (écart-type 5%, limite à 20%)
+        random_factors = self._rng.normal(1.0, 0.05, size=(len(buildings_chunk), num_points))
+        np.clip(random_factors, 0.8, 1.2, out=random_factors)
+        
+        # tampon unique du paquet: une ligne par bâtiment, remplie par le noyau du paquet
+        # (bâtiments répartis sur les threads si numba est installé)
+        consumptions = np.empty((len(buildings_chunk), num_points), dtype=np.float32)
+        _chunk_kernel(
+            base_consumptions * interval_hours, type_codes, factor_table, random_factors, consumptions
+        )
+        
+        # debug: premiers points de chaque bâtiment (formatage uniquement si le niveau DEBUG est actif)
+        if logger.isEnabledFor(logging.DEBUG):
+            for j in range(len(buildings_chunk)):
+                logger.debug(
+                    "bâtiment %s (%s, base %.3f kWh/h, intervalle %.2fh) - 3 premiers points: %s",
+                    building_ids[j], building_types[j], base_consumptions[j],
+                    interval_hours, consumptions[j, :3]
+                )
+        
+        # arrondi à 4 décimales en place sur le tampon du paquet (pas de copie)
+        np.round(consumptions, 4, out=consumptions)
+        
+        # colonnes construites en une fois (attributs statiques répétés sur chaque point)
+        return {
+            'building_id': _repeat_column(buildings_chunk['building_id'], num_points),
+            'timestamp': np.tile(date_range.values, len(buildings_chunk)) if with_timestamps else None,
+            'consumption_kwh': consumptions.ravel(),
+            'building_type': _repeat_column(buildings_chunk['building_type'], num_points),
+            'latitude': _repeat_column(buildings_chunk['latitude'], num_points),
+            'longitude': _repeat_column(buildings_chunk['longitude'], num_points),
+            'zone_name': _repeat_column(buildings_chunk['zone_name'], num_points)
+        }
     
-    def _generate_building_timeseries(self, building: Dict, date_range: pd.DatetimeIndex) -> List[Dict]:
+    def _estimate_base_consumptions(self, type_codes: np.ndarray, surface_areas: np.ndarray) -> np.ndarray:
         """
-        Génère la série temporelle avec TOUS les patterns Malaysia
+        Estime la consommation de base de tous les bâtiments (spécifications Malaysia)
         
         Args:
-            building: Données du bâtiment OSM
-            date_range: Plage temporelle pandas
+            type_codes: code du type de chaque bâtiment (voir _building_type_codes)
+            surface_areas: surface de chaque bâtiment (m²)
             
         Returns:
-            List[Dict]: Points de données avec patterns Malaysia complets
+            np.ndarray: consommation de base (kWh/heure) de chaque bâtiment
         """
-        building_id = building['id']
-        building_type = building['building_type']
-        surface_area = building.get('surface_area_m2', 100)
+        surface_factors = np.clip(surface_areas / 100.0, 0.1, 10.0)  # Limiter 10m² à 1000m²
         
-        # consommation de base (kWh/heure) selon spécifications Malaysia
-        base_consumption_hourly = self._estimate_base_consumption(building_type, surface_area)
+        base = np.clip(_BASE_ARRAY[type_codes] * surface_factors, 0.1, 500.0)  # limites de sécurité
         
-        data_points = []
+        return base.astype(np.float32)
+    
+    def get_generation_summary(self, buildings: List, timeseries_df: pd.DataFrame) -> Dict:
+        """
+        Résumé statistique d'une génération (bâtiments et consommations)
         
-        for timestamp in date_range:
-            # 1/Facteur horaire tropical Malaysia
-            hour_factor = self._get_hourly_factor(timestamp.hour, building_type)
-            
-            # 2/Facteur hebdomadaire Malaysia
-            day_factor = self._get_daily_factor(timestamp.weekday(), building_type)
-            
-            # 3/Facteur saisonnier Malaysia
-            seasonal_factor = self._get_seasonal_factor(timestamp.month)
-            
-            # 4/Facteur Ramadan Malaysia
-            ramadan_factor = self._get_ramadan_factor(timestamp.month, timestamp.hour, building_type)
-            
-            # 5 /Facteur prière du vendredi
-            friday_factor = self._get_friday_prayer_factor(timestamp.weekday(), timestamp.hour, building_type)
-            
-            # 6/ Variation aléatoire / pour crée un variation par rapport à un autre building
-            random_factor = np.random.normal(1.0, 0.05)  # écart-type = 5% 
-            random_factor = max(0.8, min(random_factor, 1.2))  # limite à 20%
-            
-            # 7/ Calcul de la durée de l'intervalle
-            if len(date_range) > 1:
-                interval_hours = (date_range[1] - date_range[0]).total_seconds() / 3600
-            else:
-                interval_hours = 1.0
+        Les distributions des bâtiments sont comptées par np.unique sur les
+        attributs extraits une fois (un passage en C, sans Series intermédiaire).
+        
+        Args:
+            buildings: objets Building générés
+            timeseries_df: séries temporelles générées
             
-            # 8/ calcul avec tous les patterns
-            consumption = (base_consumption_hourly * # Base kWh/h (specs Malaysia)
-                          hour_factor * # pattern tropical
-                          day_factor * # pattern hebdomadaire
-                          seasonal_factor * # pattern saisonnier
-                          ramadan_factor * # pattern ramadan
-                          friday_factor *  # pattern vendredi
-                          random_factor * # variation
-                          interval_hours) # durée de l'intervalle
+        Returns:
+            Dict: distributions des types / zones et statistiques de consommation
+        """
+        summary = {
+            'buildings_summary': {
+                'total_buildings': len(buildings),
+                'types_distribution': _count_values([b.building_type for b in buildings]),
+                'zones_distribution': _count_values([b.zone_name for b in buildings])
+            },
+            'consumption_statistics': {}
+        }
+        
+        if timeseries_df is not None and not timeseries_df.empty:
+            # colonne lue sans copie (float32 en sortie du générateur), statistiques
+            # calculées en une seule passe: somme, écarts, minimum et maximum
+            consumptions = timeseries_df['consumption_kwh'].to_numpy()
+            if consumptions.dtype.kind != 'f':
+                consumptions = consumptions.astype(np.float64)
             
-            # 9. Limites de sécurité
-            consumption = max(0.001, consumption)  # Minimum technique
+            count = len(consumptions)
+            total, shifted, shifted_squares, minimum, maximum = _consumption_stats(consumptions)
+            mean = total / count
+            variance = (shifted_squares - shifted * shifted / count) / (count - 1) if count > 1 else 0.0
+            std = float(np.sqrt(max(variance, 0.0)))
             
-            # 10. Debug pour les premiers points
-            if len(data_points) < 3:
-                logger.info(f"  Point {len(data_points)+1} - {building_type} {surface_area}m²:")
-                logger.info(f"   Base: {base_consumption_hourly:.3f} kWh/h")
-                logger.info(f"   Facteurs: hour={hour_factor:.2f}, day={day_factor:.2f}, season={seasonal_factor:.2f}")
-                logger.info(f"   Ramadan={ramadan_factor:.2f}, vendredi={friday_factor:.2f}, random={random_factor:.2f}")
-                logger.info(f"   Intervalle: {interval_hours:.2f}h")
-                logger.info(f"   Final: {consumption:.4f} kWh")
+            by_type = timeseries_df.groupby('building_type', observed=True)['consumption_kwh'].sum()
             
-            data_points.append({
-                'building_id': building_id,
-                'timestamp': timestamp,
-                'consumption_kwh': round(consumption, 4),
-                'building_type': building_type,
-                'latitude': building['latitude'],
-                'longitude': building['longitude'],
-                'zone_name': building['zone_name']
-            })
-        
-        return data_points
+            summary['consumption_statistics'] = {
+                'total_observations': count,
+                'total_consumption_kwh': round(total, 2),
+                'mean_consumption_kwh': round(mean, 4),
+                'max_consumption_kwh': round(maximum, 4),
+                'min_consumption_kwh': round(minimum, 4),
+                'std_consumption_kwh': round(std, 4),
+                'coefficient_of_variation': round(std / mean, 4) if mean else 0.0,
+                'consumption_by_type': {
+                    building_type: round(float(total), 2) for building_type, total in by_type.items()
+                }
+            }
+        
+        return summary
     
     def get_statistics(self) -> Dict:
         
@@ -479,10 +1139,178 @@ class ElectricityDataGenerator:
         }
 
 
+def _count_values(values: List) -> Dict:
+    """
+    Nombre d'occurrences de chaque valeur (clés triées) via np.unique
+    
+    Returns:
+        Dict: {valeur: occurrences}
+    """
+    if not values:
+        return {}
+    
+    unique_values, counts = np.unique(np.asarray(values, dtype=str), return_counts=True)
+    return dict(zip(unique_values.tolist(), counts.tolist()))
+
+
+def _generate_chunk_worker(
+    buildings_chunk: pd.DataFrame, 
+    start_date: str, 
+    end_date: str, 
+    frequency: str, 
+    seed: int
+) -> Dict[str, np.ndarray]:
+    """
+    Génère un paquet de bâtiments dans un processus séparé
+    
+    Seule la période est transmise: l'index temporel est reconstruit une fois par
+    processus (cache _time_features réutilisé d'un paquet à l'autre); chaque
+    paquet a sa propre graine. La colonne timestamp, identique pour tous les
+    paquets, n'est pas renvoyée: le processus principal la reconstruit depuis
+    son propre index au lieu de la recevoir sérialisée.
+    """
+    generator = ElectricityDataGenerator(seed=seed)
+    return generator._generate_chunk(
+        buildings_chunk, start_date, end_date, frequency, with_timestamps=False
+    )
+
+
+def _generate_partition(
+    buildings_partition: pd.DataFrame, 
+    start_date: str, 
+    end_date: str, 
+    frequency: str, 
+    base_seed: int,
+    partition_info: Optional[Dict] = None
+) -> pd.DataFrame:
+    """
+    Génère les séries d'une partition de bâtiments (appelée par dask map_partitions)
+    
+    La graine de la partition est dérivée de la graine de base et du numéro de
+    partition fourni par dask: résultat reproductible quel que soit l'ordonnancement.
+    """
+    number = partition_info['number'] if partition_info else 0
+    seed = int(np.random.SeedSequence([base_seed, number]).generate_state(1)[0])
+    generator = ElectricityDataGenerator(seed=seed)
+    
+    building_columns = generator._prepare_building_columns(buildings_partition)
+    if building_columns.empty:
+        return _empty_timeseries_frame()
+    
+    chunk_columns = generator._generate_chunk(building_columns, start_date, end_date, frequency)
+    return pd.DataFrame(chunk_columns, copy=False).astype(_OUTPUT_DTYPES)
+
+
+def _empty_timeseries_frame() -> pd.DataFrame:
+    """DataFrame vide aux colonnes et types de sortie (schéma des partitions dask)"""
+    return pd.DataFrame({
+        'building_id': pd.Categorical([]),
+        'timestamp': pd.Series([], dtype='datetime64[ns]'),
+        'consumption_kwh': pd.Series([], dtype='float32'),
+        'building_type': pd.Categorical([]),
+        'latitude': pd.Series([], dtype='float32'),
+        'longitude': pd.Series([], dtype='float32'),
+        'zone_name': pd.Categorical([])
+    })
+
+
+def _repeat_column(column: pd.Series, repeats: int):
+    """
+    Répète chaque valeur d'une colonne de bâtiments sur tous les points temporels
+    
+    Pour une colonne catégorielle seuls les codes entiers sont répétés, les
+    catégories (communes à tous les paquets) sont conservées.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(
+            np.repeat(column.cat.codes.to_numpy(), repeats), dtype=column.dtype
+        )
+    return np.repeat(column.to_numpy(), repeats)
+
+
+def _concat_columns(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Assemble les colonnes de plusieurs paquets colonne par colonne
+    
+    Évite la construction d'un DataFrame par paquet suivie de pd.concat: chaque
+    colonne est une simple concaténation de tableaux (codes seulement pour les
+    colonnes catégorielles, dont les catégories sont communes aux paquets).
+    """
+    columns = {}
+    
+    for name, first in chunks[0].items():
+        if isinstance(first, pd.Categorical):
+            columns[name] = pd.Categorical.from_codes(
+                np.concatenate([chunk[name].codes for chunk in chunks]), dtype=first.dtype
+            )
+        else:
+            columns[name] = np.concatenate([chunk[name] for chunk in chunks])
+    
+    return columns
+
+
+def _columns_to_arrow(columns: Dict[str, np.ndarray]) -> pa.Table:
+    """
+    Construit une table Arrow directement depuis les colonnes NumPy d'un paquet
+    
+    Les colonnes numériques sont reprises sans passer par pandas (float32 sans
+    copie), les colonnes de chaînes répétées sont encodées en dictionnaire.
+    """
+    arrays = []
+    
+    for name, values in columns.items():
+        dtype = _OUTPUT_DTYPES.get(name)
+        if dtype == 'category':
+            array = pa.array(values)
+            if not pa.types.is_dictionary(array.type):
+                array = array.dictionary_encode()
+            arrays.append(array)
+        elif dtype is not None:
+            arrays.append(pa.array(values.astype(dtype, copy=False)))
+        else:
+            arrays.append(pa.array(values))
+    
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
 # ==============================================================================
 # FONCTIONS UTILITAIRES DE VALIDATION
 # ==============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _count_periods(start_ts: pd.Timestamp, end_ts: pd.Timestamp, frequency: str) -> int:
+    """
+    Nombre de périodes (bornes incluses, comme pd.date_range) d'une plage temporelle
+    
+    Pour les fréquences à pas fixe (minutes, heures, jours) le nombre est calculé
+    sans construire l'index temporel; mis en cache par période car validation,
+    estimation et génération interrogent successivement la même plage.
+    """
+    offset = pd.tseries.frequencies.to_offset(frequency)
+    
+    if isinstance(offset, pd.offsets.Tick):
+        return max(0, (end_ts - start_ts) // pd.Timedelta(offset) + 1)
+    
+    return len(pd.date_range(start=start_ts, end=end_ts, freq=offset))
+
+
+def compute_total_observations(
+    start_ts: pd.Timestamp,
+    end_ts: pd.Timestamp,
+    frequency: str,
+    num_buildings: int
+) -> Tuple[int, int]:
+    """
+    Nombre de périodes (bornes incluses, comme pd.date_range) et d'observations
+    
+    Returns:
+        Tuple[int, int]: (périodes par bâtiment, observations totales)
+    """
+    periods = _count_periods(start_ts, end_ts, frequency)
+    
+    return periods, num_buildings * periods
+
+
 def validate_generation_parameters(
     start_date: str, 
     end_date: str, 
@@ -503,7 +1331,7 @@ def validate_generation_parameters(
     """
     errors = []
     
-    # validation des dates
+    # validation des dates (analysées une seule fois, réutilisées pour la charge de travail)
     try:
         if not start_date or not end_date:
             errors.append("dates de début et fin requises")
@@ -541,20 +1369,11 @@ def validate_generation_parameters(
     # validation de la charge de travail
     try:
         if len(errors) == 0:
-            start = pd.to_datetime(start_date)
-            end = pd.to_datetime(end_date)
-            
-            # calcul du nombre d'observations en minutes
-            freq_minutes = {'15T': 15, '30T': 30, '1H': 60, '3H': 180, 'D': 1440}
+            _, total_observations = compute_total_observations(start, end, frequency, num_buildings)
             
-            if frequency in freq_minutes:
-                total_minutes = (end - start).total_seconds() / 60
-                observations_per_building = total_minutes / freq_minutes[frequency]
-                total_observations = num_buildings * observations_per_building
-                
-                # limite technique: 500 millions de points
-                if total_observations > 500_000_000:
-                    errors.append(f"Trop d'observations ({int(total_observations):,}). Réduire la période ou le nombre de bâtiments.")
+            # limite technique: 500 millions de points
+            if total_observations > 500_000_000:
+                errors.append(f"Trop d'observations ({total_observations:,}). Réduire la période ou le nombre de bâtiments.")
     
     except Exception as e:
         errors.append(f"Erreur de validation: {str(e)}")
@@ -566,7 +1385,9 @@ def estimate_generation_time(
     num_buildings: int, 
     start_date: str, 
     end_date: str, 
-    frequency: str
+    frequency: str,
+    start_ts: Optional[pd.Timestamp] = None,
+    end_ts: Optional[pd.Timestamp] = None
 ) -> Dict:
     """
     Estime le temps et les ressources de génération
@@ -576,17 +1397,17 @@ def estimate_generation_time(
         start_date: Date de début
         end_date: Date de fin
         frequency: Fréquence
+        start_ts: date de début déjà analysée (évite une nouvelle analyse)
+        end_ts: date de fin déjà analysée
         
     Returns:
         Dict: Estimation détaillée
     """
     try:
         # calcul du nombre d'observations
-        start = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
-        date_range = pd.date_range(start=start, end=end, freq=frequency)
-        
-        total_observations = num_buildings * len(date_range)
+        start = start_ts if start_ts is not None else pd.to_datetime(start_date)
+        end = end_ts if end_ts is not None else pd.to_datetime(end_date)
+        periods, total_observations = compute_total_observations(start, end, frequency, num_buildings)
         
         # estimation du temps
         observations_per_second = 15000 
@@ -618,7 +1439,7 @@ def estimate_generation_time(
             'complexity': complexity,
             'recommendation': recommendation,
             'buildings_count': num_buildings,
-            'time_periods': len(date_range)
+            'time_periods': periods
         }
         
     except Exception as e:
@@ -11,12 +11,51 @@ Version: 3.0 - Administrative First
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import logging
+import threading
+import hashlib
+import os
+import random
+import sqlite3
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import math
+from operator import itemgetter
+from types import MappingProxyType
+
+import numpy as np
+
+from config import OSM_CONFIG
+
+# Compilation JIT du calcul des centres et surfaces (optionnelle, repli NumPy sinon)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Décodage JSON rapide (optionnel, json standard sinon)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+# Lecture en flux des réponses Overpass (optionnelle)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Configuration des APIs Overpass
 OVERPASS_APIS = [
@@ -25,8 +64,425 @@ OVERPASS_APIS = [
     'https://lz4.overpass-api.de/api/interpreter'
 ]
 
+NOMINATIM_SEARCH_URL = 'https://nominatim.openstreetmap.org/search'
+
 logger = logging.getLogger(__name__)
 
+# Backoff des retries Overpass (secondes)
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 30.0
+
+# Taille des blocs lus sur le flux Overpass (arrêt vérifié entre deux blocs)
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Relations administratives OSM validées pour Malaysia (zone_id → relation)
+_ADMIN_RELATIONS = MappingProxyType({
+    # PAYS
+    'malaysia': 2108121,           # Malaysia complète
+
+    # ÉTATS (Relations officielles OSM)
+    'selangor': 1396404,           # État Selangor
+    'johor': 1396389,              # État Johor
+    'penang': 1396398,             # État Penang
+    'perak': 1396400,              # État Perak
+    'sabah': 1396403,              # État Sabah
+    'sarawak': 1396405,            # État Sarawak
+    'kelantan': 1396391,           # État Kelantan
+    'terengganu': 1396407,         # État Terengganu
+    'pahang': 1396397,             # État Pahang
+    'kedah': 1396390,              # État Kedah
+    'perlis': 1396399,             # État Perlis
+    'negeri_sembilan': 1396396,    # État Negeri Sembilan
+    'melaka': 1396394,             # État Melaka
+
+    # TERRITOIRES FÉDÉRAUX
+    'kuala_lumpur': 1396402,       # Federal Territory KL
+    'putrajaya': 1896031,          # Federal Territory Putrajaya
+    'labuan': 1396408,             # Federal Territory Labuan
+
+    # GRANDES VILLES (Relations municipales)
+    'george_town': 7055974,        # George Town, Penang
+    'johor_bahru': 7055980,        # Johor Bahru
+    'ipoh': 7055978,               # Ipoh, Perak
+    'shah_alam': 7055976,          # Shah Alam, Selangor
+    'malacca_city': 7055982,       # Malacca City
+    'kota_kinabalu': 7055984,      # Kota Kinabalu, Sabah
+    'kuching': 7055986,            # Kuching, Sarawak
+    'petaling_jaya': 7055988,      # Petaling Jaya, Selangor
+    'subang_jaya': 7055990,        # Subang Jaya, Selangor
+})
+
+# Bounding boxes optimisées et étendues [ouest, sud, est, nord] (zone_id, bbox)
+_BBOX_DEFINITIONS = (
+    # PAYS
+    ('malaysia', (99.0, 0.5, 119.5, 7.5)),
+
+    # GRANDES MÉTROPOLES
+    ('kuala_lumpur', (101.55, 3.00, 101.80, 3.30)),         # Zone métropolitaine KL
+    ('george_town', (100.25, 5.35, 100.40, 5.50)),          # George Town étendu
+    ('johor_bahru', (103.70, 1.40, 103.90, 1.60)),          # JB + périphérie
+
+    # VILLES MOYENNES
+    ('putrajaya', (101.64, 2.88, 101.76, 3.08)),            # Putrajaya complet
+    ('shah_alam', (101.45, 3.00, 101.65, 3.20)),            # Shah Alam étendu
+    ('ipoh', (101.05, 4.50, 101.20, 4.70)),                 # Ipoh métropole
+    ('petaling_jaya', (101.58, 3.08, 101.68, 3.18)),        # PJ complet
+    ('subang_jaya', (101.56, 3.03, 101.62, 3.08)),          # Subang Jaya
+
+    # ÉTATS (bbox larges)
+    ('selangor', (100.5, 2.5, 102.2, 4.0)),                 # État Selangor complet
+    ('johor', (102.3, 1.0, 104.5, 3.0)),                    # État Johor complet
+    ('penang', (100.0, 5.1, 100.7, 5.7)),                   # Penang île + continent
+    ('perak', (99.8, 3.4, 102.0, 6.0)),                     # État Perak
+    ('sabah', (115.0, 4.0, 119.5, 7.5)),                    # État Sabah
+    ('sarawak', (109.0, 0.8, 115.5, 5.0)),                  # État Sarawak
+    ('pahang', (101.8, 2.2, 104.5, 4.8)),                   # État Pahang
+    ('kelantan', (101.2, 4.5, 102.8, 6.3)),                 # État Kelantan
+    ('terengganu', (102.5, 4.0, 103.8, 5.8)),               # État Terengganu
+    ('kedah', (100.0, 5.4, 101.0, 6.8)),                    # État Kedah
+    ('perlis', (100.0, 6.2, 100.3, 6.8)),                   # État Perlis
+    ('negeri_sembilan', (101.4, 2.3, 102.8, 3.0)),          # État Negeri Sembilan
+    ('melaka', (102.0, 2.0, 102.6, 2.4)),                   # État Melaka
+)
+
+# Bboxes en tableau (une ligne par zone, lecture seule) et ligne de chaque zone_id
+_BBOX_INDEX = MappingProxyType({zone_id: row for row, (zone_id, _) in enumerate(_BBOX_DEFINITIONS)})
+_BBOXES = np.array([bbox for _, bbox in _BBOX_DEFINITIONS], dtype=np.float64)
+_BBOXES.flags.writeable = False
+
+# Mapping des tags OSM building vers nos catégories
+_BUILDING_TYPE_MAP = {
+    # Résidentiel
+    'residential': 'residential',
+    'house': 'residential',
+    'detached': 'residential',
+    'terrace': 'residential',
+    'apartment': 'residential',
+    'apartments': 'residential',
+    'dormitory': 'residential',
+    'bungalow': 'residential',
+
+    # Commercial
+    'commercial': 'commercial',
+    'retail': 'commercial',
+    'shop': 'commercial',
+    'mall': 'commercial',
+    'supermarket': 'commercial',
+    'office': 'commercial',
+    'hotel': 'commercial',
+    'restaurant': 'commercial',
+
+    # Industriel
+    'industrial': 'industrial',
+    'warehouse': 'industrial',
+    'factory': 'industrial',
+    'manufacture': 'industrial',
+    'storage': 'industrial',
+
+    # Public/Institutionnel
+    'school': 'public',
+    'hospital': 'public',
+    'university': 'public',
+    'college': 'public',
+    'clinic': 'public',
+    'government': 'public',
+    'civic': 'public',
+    'public': 'public',
+    'religious': 'public',
+    'mosque': 'public',
+    'temple': 'public',
+    'church': 'public',
+}
+
+# Catégorie déduite du tag amenity (si le tag building ne suffit pas)
+_AMENITY_TYPE_MAP = {
+    'school': 'public',
+    'hospital': 'public',
+    'clinic': 'public',
+    'university': 'public',
+    'restaurant': 'commercial',
+    'cafe': 'commercial',
+    'bank': 'commercial',
+    'shop': 'commercial',
+}
+
+# Catégorie déduite de la seule présence d'un tag, dans l'ordre de priorité
+_TAG_PRESENCE_TYPES = (
+    ('shop', 'commercial'),
+    ('office', 'commercial'),
+    ('industrial', 'industrial'),
+)
+
+# Valeurs du tag building qui ne désignent pas un bâtiment
+_REJECTED_BUILDING_TAGS = frozenset({'no', 'false', '', None})
+
+# Accès aux coordonnées des noeuds de la géométrie Overpass
+_get_lat = itemgetter('lat')
+_get_lon = itemgetter('lon')
+
+
+def _geometry_metrics_numpy(lats: np.ndarray, lons: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Centre et surface du polygone de tous les bâtiments en une fois (version NumPy)
+    
+    Args:
+        lats, lons: coordonnées de tous les noeuds, bâtiment après bâtiment
+        offsets: indice du premier noeud de chaque bâtiment
+        
+    Returns:
+        Tuple: (latitudes des centres, longitudes des centres, surfaces en m²)
+    """
+    counts = np.diff(np.append(offsets, len(lats)))
+    center_lats = np.add.reduceat(lats, offsets) / counts
+    center_lons = np.add.reduceat(lons, offsets) / counts
+    
+    # Projection équirectangulaire locale autour du centre de chaque bâtiment (mètres)
+    meters_per_degree = 111000
+    node_center_lats = np.repeat(center_lats, counts)
+    x = (lons - np.repeat(center_lons, counts)) * meters_per_degree * np.cos(np.radians(node_center_lats))
+    y = (lats - node_center_lats) * meters_per_degree
+    
+    # Formule du lacet (shoelace): noeud suivant dans le même polygone, le dernier rejoint le premier
+    next_nodes = np.arange(1, len(lats) + 1)
+    next_nodes[offsets + counts - 1] = offsets
+    areas = 0.5 * np.abs(np.add.reduceat(x * y[next_nodes] - x[next_nodes] * y, offsets))
+    
+    # Borner la surface entre des valeurs réalistes
+    return center_lats, center_lons, np.clip(areas, 20, 10000)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _geometry_metrics(lats, lons, offsets):
+        # même calcul que _geometry_metrics_numpy, bâtiments répartis entre les threads (prange),
+        # sans tableaux intermédiaires par noeud
+        num_buildings = offsets.size
+        center_lats = np.empty(num_buildings)
+        center_lons = np.empty(num_buildings)
+        areas = np.empty(num_buildings)
+        
+        for b in prange(num_buildings):
+            start = offsets[b]
+            end = offsets[b + 1] if b + 1 < num_buildings else lats.size
+            
+            lat_sum = 0.0
+            lon_sum = 0.0
+            for i in range(start, end):
+                lat_sum += lats[i]
+                lon_sum += lons[i]
+            center_lat = lat_sum / (end - start)
+            center_lon = lon_sum / (end - start)
+            
+            x_scale = 111000 * np.cos(np.radians(center_lat))
+            twice_area = 0.0
+            for i in range(start, end):
+                j = i + 1 if i + 1 < end else start
+                twice_area += ((lons[i] - center_lon) * x_scale * (lats[j] - center_lat) * 111000 -
+                               (lons[j] - center_lon) * x_scale * (lats[i] - center_lat) * 111000)
+            
+            center_lats[b] = center_lat
+            center_lons[b] = center_lon
+            areas[b] = min(max(0.5 * abs(twice_area), 20.0), 10000.0)
+        
+        return center_lats, center_lons, areas
+else:
+    _geometry_metrics = _geometry_metrics_numpy
+
+
+class _StoppableReader:
+    """
+    Flux de réponse lu par blocs, interrompu dès qu'un autre miroir a répondu
+    
+    Un miroir perdant ne télécharge pas le reste d'un corps de plusieurs centaines
+    de Mo: la lecture s'arrête au bloc suivant et la réponse est fermée.
+    """
+    
+    def __init__(self, response: requests.Response, stop_event: threading.Event):
+        self._chunks = response.iter_content(chunk_size=_READ_CHUNK_BYTES)
+        self._stop_event = stop_event
+        self._buffer = b''
+    
+    def _next_chunk(self) -> bytes:
+        if self._stop_event.is_set():
+            raise InterruptedError("Réponse obtenue sur un autre miroir")
+        return next(self._chunks, b'')
+    
+    def read(self, size: int = -1) -> bytes:
+        """Lit au plus size octets décompressés (tout le corps si size < 0)"""
+        if size is None or size < 0:
+            parts = [self._buffer]
+            chunk = self._next_chunk()
+            while chunk:
+                parts.append(chunk)
+                chunk = self._next_chunk()
+            self._buffer = b''
+            return b''.join(parts)
+        
+        if not self._buffer:
+            self._buffer = self._next_chunk()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _TokenBucket:
+    """
+    Limiteur de débit à jetons (token bucket)
+    
+    Un jeton est regénéré toutes les 1/rate secondes, au plus `capacity` jetons
+    en réserve; chaque requête consomme un jeton ou attend le suivant.
+    """
+    
+    def __init__(self, rate_per_second: float, capacity: float = 1.0):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """Attend et consomme un jeton; False si l'attente est interrompue par stop_event"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                
+                wait_time = (1 - self._tokens) / self.rate_per_second
+            
+            if stop_event is None:
+                time.sleep(wait_time)
+            elif stop_event.wait(wait_time):
+                return False
+
+
+# Limiteurs par hôte Overpass (débit + requêtes simultanées), communs à tous les chargeurs
+_HOST_LIMITERS: Dict[str, Tuple[_TokenBucket, threading.BoundedSemaphore]] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+
+def _host_limiter(url: str) -> Tuple[_TokenBucket, threading.BoundedSemaphore]:
+    """Limiteur de débit et sémaphore de concurrence de l'hôte d'une URL"""
+    host = urlsplit(url).netloc
+    with _HOST_LIMITERS_LOCK:
+        if host not in _HOST_LIMITERS:
+            _HOST_LIMITERS[host] = (
+                _TokenBucket(OSM_CONFIG.OVERPASS_RATE_PER_SECOND),
+                threading.BoundedSemaphore(OSM_CONFIG.OVERPASS_MAX_CONCURRENT)
+            )
+        return _HOST_LIMITERS[host]
+
+
+# Nominatim: 1 requête par seconde au maximum (politique d'usage OSM), commun à tous les chargeurs
+_NOMINATIM_LIMITER = _TokenBucket(rate_per_second=1.0)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Attente avant retry: backoff exponentiel avec gigue complète (full jitter)
+    
+    Délai tiré uniformément dans [0, min(plafond, base × 2^tentative)]: des clients
+    qui échouent en même temps ne relancent pas leurs requêtes en même temps.
+    """
+    return random.uniform(0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Délai de l'en-tête Retry-After (en secondes), None s'il est absent ou illisible"""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
+class _ResponseCache:
+    """
+    Cache disque (SQLite) des réponses OSM déjà décodées
+    
+    Clé: sha256 de la requête. Les réponses sont stockées en JSON (jamais en pickle:
+    le chemin du cache vient de l'environnement, son contenu n'est pas sûr). Les
+    entrées expirées sont purgées à l'écriture et la taille totale est plafonnée,
+    les réponses les plus anciennes étant évincées en premier.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            # Rend l'espace des lignes supprimées au disque (effectif sur une base neuve)
+            self._connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS osm_responses "
+                "(key TEXT PRIMARY KEY, created REAL, size INTEGER, payload BLOB)"
+            )
+            self._purge_expired()
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Clé de cache d'une requête"""
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str):
+        """Réponse en cache non expirée, ou None"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM osm_responses WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return _json_loads(row[0]) if row else None
+    
+    def set(self, key: str, value) -> None:
+        """Enregistre (ou remplace) une réponse, puis purge et applique le plafond de taille"""
+        payload = _json_dumps(value)
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO osm_responses (key, created, size, payload) VALUES (?, ?, ?, ?)",
+                (key, time.time(), len(payload), sqlite3.Binary(payload))
+            )
+            self._purge_expired()
+            self._enforce_size_limit()
+        with self._lock:
+            self._connection.execute("PRAGMA incremental_vacuum")
+    
+    def _purge_expired(self) -> None:
+        """Supprime les entrées expirées (appelé sous verrou)"""
+        self._connection.execute(
+            "DELETE FROM osm_responses WHERE created < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+    
+    def _enforce_size_limit(self) -> None:
+        """Évince les entrées les plus anciennes au-delà du plafond (appelé sous verrou)"""
+        rows = self._connection.execute(
+            "SELECT key, size FROM osm_responses ORDER BY created DESC"
+        ).fetchall()
+        
+        total = 0
+        evicted = []
+        for key, size in rows:
+            total += size or 0
+            if total > self.max_bytes:
+                evicted.append((key,))
+        
+        if evicted:
+            self._connection.executemany("DELETE FROM osm_responses WHERE key = ?", evicted)
+
 
 @dataclass
 class OSMResult:
@@ -50,11 +506,34 @@ class CompleteBuildingLoader:
     Garantit la meilleure précision et couverture possible
     """
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = OSM_CONFIG.CACHE_ENABLED):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Malaysia-Complete-Building-Generator-Admin-Priority/3.0'
+            'User-Agent': 'Malaysia-Complete-Building-Generator-Admin-Priority/3.0',
+            'Connection': 'keep-alive'
         })
+        
+        # Pool de connexions persistantes partagé par Overpass (miroirs en parallèle)
+        # et Nominatim: pas de nouvelle poignée de main TCP/TLS à chaque retry
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Relations administratives trouvées par prefetch_nominatim (zone_id → relation)
+        self._discovered_relations = {}
+        
+        # Cache disque des réponses (optionnel, une erreur de cache ne bloque jamais le chargement)
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = _ResponseCache(
+                    OSM_CONFIG.CACHE_PATH,
+                    OSM_CONFIG.CACHE_TTL_SECONDS,
+                    OSM_CONFIG.CACHE_MAX_BYTES
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Cache OSM indisponible: {str(e)}")
+        
         self.stats = {
             'total_queries': 0,
             'successful_queries': 0,
@@ -178,6 +657,101 @@ class CompleteBuildingLoader:
                 error_message=f"Erreur globale: {str(e)}"
             )
 
+    def load_many(
+        self, 
+        zone_ids: List[str], 
+        zone_names: Optional[List[str]] = None
+    ) -> Dict[str, OSMResult]:
+        """
+        Charge plusieurs zones avec UNE seule requête Overpass
+        
+        Les zones ayant une relation administrative sont regroupées dans une requête
+        unique (un bloc par zone, précédé de l'id de sa relation pour séparer les
+        résultats). Les autres zones, et celles sans bâtiment dans la réponse,
+        passent par load_complete_locality_buildings.
+        
+        Args:
+            zone_ids: Identifiants des zones
+            zone_names: Noms des zones (mêmes positions, zone_id par défaut)
+        
+        Returns:
+            Dict[str, OSMResult]: Résultat par zone_id
+        """
+        start_time = time.time()
+        zone_names = zone_names or zone_ids
+        results = {}
+        
+        # Zones regroupables: relation administrative connue (relation → zone)
+        batched = {}
+        for zone_id, zone_name in zip(zone_ids, zone_names):
+            relation_id = self._relation_for_zone(zone_id)
+            if relation_id and relation_id not in batched:
+                batched[relation_id] = (zone_id, zone_name)
+        
+        if len(batched) > 1:
+            logger.info(f"📦 Requête groupée pour {len(batched)} zones administratives")
+            
+            blocks = '\n'.join(
+                f"relation({relation_id}); out ids; map_to_area -> .area_{index}; "
+                f"way[\"building\"](area.area_{index}); out geom;"
+                for index, relation_id in enumerate(batched)
+            )
+            query = f"[out:json][timeout:300][maxsize:2147483648];\n{blocks}"
+            
+            # Une seule requête HTTP pour toutes les zones du lot
+            self.stats['total_queries'] += 1
+            
+            try:
+                osm_data = self._execute_overpass_query(query)
+                
+                # Un remark signale une réponse tronquée par le serveur: couverture non garantie
+                remark = osm_data.get('remark')
+                if remark:
+                    logger.warning(f"⚠️ Réponse Overpass groupée partielle: {remark}")
+                
+                # Répartition des éléments: chaque relation ouvre le bloc de sa zone
+                elements_by_relation = {relation_id: [] for relation_id in batched}
+                current = None
+                for element in osm_data.get('elements', []):
+                    if element.get('type') == 'relation' and element.get('id') in elements_by_relation:
+                        current = elements_by_relation[element['id']]
+                    elif current is not None:
+                        current.append(element)
+                
+                for relation_id, (zone_id, zone_name) in batched.items():
+                    elements = elements_by_relation[relation_id]
+                    buildings = self._process_osm_elements(elements, zone_name) if elements else []
+                    
+                    if not buildings:
+                        continue
+                    
+                    self.stats['buildings_loaded'] += len(buildings)
+                    self.stats['method_success_count']['administrative'] += 1
+                    
+                    results[zone_id] = OSMResult(
+                        buildings=buildings,
+                        total_elements=len(elements),
+                        query_time_seconds=time.time() - start_time,
+                        method_used='administrative_batch',
+                        coverage_complete=not remark,
+                        success=True,
+                        quality_score=self._calculate_quality_score(buildings)
+                    )
+                    logger.info(f"✅ {zone_name}: {len(buildings):,} bâtiments (requête groupée)")
+                
+                if results:
+                    self.stats['successful_queries'] += 1
+                    
+            except Exception as e:
+                logger.warning(f"⚠️ Requête groupée échouée, chargement zone par zone: {str(e)}")
+        
+        # Zones restantes: chargement individuel (administrative → bbox → nominatim)
+        for zone_id, zone_name in zip(zone_ids, zone_names):
+            if zone_id not in results:
+                results[zone_id] = self.load_complete_locality_buildings(zone_id, zone_name)
+        
+        return results
+
     def _load_by_administrative_boundary(self, zone_id: str, zone_name: str) -> OSMResult:
         """
         🥇 MÉTHODE PRIORITAIRE: Relations administratives OSM
@@ -190,48 +764,11 @@ class CompleteBuildingLoader:
         """
         logger.info(f"🗺️ Chargement administratif PRIORITAIRE: {zone_name}")
         
-        # Relations administratives OSM validées pour Malaysia
-        administrative_relations = {
-            # PAYS
-            'malaysia': 2108121,           # Malaysia complète
-            
-            # ÉTATS (Relations officielles OSM)
-            'selangor': 1396404,           # État Selangor
-            'johor': 1396389,              # État Johor  
-            'penang': 1396398,             # État Penang
-            'perak': 1396400,              # État Perak
-            'sabah': 1396403,              # État Sabah
-            'sarawak': 1396405,            # État Sarawak
-            'kelantan': 1396391,           # État Kelantan
-            'terengganu': 1396407,         # État Terengganu
-            'pahang': 1396397,             # État Pahang
-            'kedah': 1396390,              # État Kedah
-            'perlis': 1396399,             # État Perlis
-            'negeri_sembilan': 1396396,    # État Negeri Sembilan
-            'melaka': 1396394,             # État Melaka
-            
-            # TERRITOIRES FÉDÉRAUX
-            'kuala_lumpur': 1396402,       # Federal Territory KL
-            'putrajaya': 1896031,          # Federal Territory Putrajaya
-            'labuan': 1396408,             # Federal Territory Labuan
-            
-            # GRANDES VILLES (Relations municipales)
-            'george_town': 7055974,        # George Town, Penang
-            'johor_bahru': 7055980,        # Johor Bahru
-            'ipoh': 7055978,               # Ipoh, Perak
-            'shah_alam': 7055976,          # Shah Alam, Selangor
-            'malacca_city': 7055982,       # Malacca City
-            'kota_kinabalu': 7055984,      # Kota Kinabalu, Sabah
-            'kuching': 7055986,            # Kuching, Sarawak
-            'petaling_jaya': 7055988,      # Petaling Jaya, Selangor
-            'subang_jaya': 7055990,        # Subang Jaya, Selangor
-        }
-        
-        relation_id = administrative_relations.get(zone_id.lower())
+        relation_id = self._relation_for_zone(zone_id)
         
         if not relation_id:
             logger.warning(f"❌ Pas de relation administrative OSM pour {zone_id}")
-            logger.info(f"📋 Relations disponibles: {list(administrative_relations.keys())}")
+            logger.info(f"📋 Relations disponibles: {list(_ADMIN_RELATIONS.keys()) + list(self._discovered_relations)}")
             raise ValueError(f"Relation administrative non disponible pour {zone_id}")
         
         logger.info(f"🎯 Utilisation relation OSM administrative: {relation_id}")
@@ -263,6 +800,11 @@ out geom;"""
                 logger.warning("⚠️ Relation administrative trouvée mais aucun bâtiment")
                 raise ValueError("Relation administrative vide")
             
+            # Un remark signale une réponse tronquée par le serveur: couverture non garantie
+            remark = osm_data.get('remark')
+            if remark:
+                logger.warning(f"⚠️ Réponse Overpass partielle: {remark}")
+            
             buildings = self._process_osm_elements(elements, zone_name)
             
             logger.info(f"🏗️ Bâtiments traités (administrative): {len(buildings):,}")
@@ -272,7 +814,7 @@ out geom;"""
                 total_elements=len(elements),
                 query_time_seconds=0,  # Sera mis à jour par la fonction appelante
                 method_used='administrative',
-                coverage_complete=True,  # Garantie par les limites officielles
+                coverage_complete=not remark,  # Garantie par les limites officielles si réponse complète
                 success=True,
                 quality_score=self._calculate_quality_score(buildings)
             )
@@ -290,46 +832,13 @@ out geom;"""
         """
         logger.info(f"📦 FALLBACK: Chargement par bbox pour {zone_name}")
         
-        # Bounding boxes optimisées et étendues
-        bboxes = {
-            # PAYS
-            'malaysia': [99.0, 0.5, 119.5, 7.5],
-            
-            # GRANDES MÉTROPOLES
-            'kuala_lumpur': [101.55, 3.00, 101.80, 3.30],    # Zone métropolitaine KL
-            'george_town': [100.25, 5.35, 100.40, 5.50],     # George Town étendu
-            'johor_bahru': [103.70, 1.40, 103.90, 1.60],     # JB + périphérie
-            
-            # VILLES MOYENNES
-            'putrajaya': [101.64, 2.88, 101.76, 3.08],       # Putrajaya complet
-            'shah_alam': [101.45, 3.00, 101.65, 3.20],       # Shah Alam étendu
-            'ipoh': [101.05, 4.50, 101.20, 4.70],            # Ipoh métropole
-            'petaling_jaya': [101.58, 3.08, 101.68, 3.18],   # PJ complet
-            'subang_jaya': [101.56, 3.03, 101.62, 3.08],     # Subang Jaya
-            
-            # ÉTATS (bbox larges)
-            'selangor': [100.5, 2.5, 102.2, 4.0],            # État Selangor complet
-            'johor': [102.3, 1.0, 104.5, 3.0],               # État Johor complet
-            'penang': [100.0, 5.1, 100.7, 5.7],              # Penang île + continent
-            'perak': [99.8, 3.4, 102.0, 6.0],                # État Perak
-            'sabah': [115.0, 4.0, 119.5, 7.5],               # État Sabah
-            'sarawak': [109.0, 0.8, 115.5, 5.0],             # État Sarawak
-            'pahang': [101.8, 2.2, 104.5, 4.8],              # État Pahang
-            'kelantan': [101.2, 4.5, 102.8, 6.3],            # État Kelantan
-            'terengganu': [102.5, 4.0, 103.8, 5.8],          # État Terengganu
-            'kedah': [100.0, 5.4, 101.0, 6.8],               # État Kedah
-            'perlis': [100.0, 6.2, 100.3, 6.8],              # État Perlis
-            'negeri_sembilan': [101.4, 2.3, 102.8, 3.0],     # État Negeri Sembilan
-            'melaka': [102.0, 2.0, 102.6, 2.4],              # État Melaka
-        }
-        
-        bbox = bboxes.get(zone_id.lower())
-        if not bbox:
+        row = _BBOX_INDEX.get(zone_id.lower())
+        if row is None:
             logger.error(f"❌ Bbox non disponible pour {zone_id}")
-            logger.info(f"📋 Bboxes disponibles: {list(bboxes.keys())}")
+            logger.info(f"📋 Bboxes disponibles: {list(_BBOX_INDEX.keys())}")
             raise ValueError(f"Bbox non disponible pour {zone_id}")
         
-        west, south, east, north = bbox
+        west, south, east, north = _BBOXES[row].tolist()
         logger.info(f"📦 Bbox utilisée: [{west}, {south}, {east}, {north}]")
         
         # Requête Overpass simplifiée pour bbox
@@ -366,17 +875,55 @@ out geom;"""
             logger.error(f"❌ Erreur méthode bbox: {e}")
             raise
 
-    def _fallback_to_nominatim_search(self, zone_name: str) -> OSMResult:
+    def prefetch_nominatim(self, zone_names: List[str], max_workers: int = 4) -> Dict[str, Optional[int]]:
         """
-        🥉 DERNIER RECOURS: Recherche par nom via Nominatim
+        Précharge les recherches Nominatim de plusieurs zones en parallèle
         
-        Utilisée seulement si administrative ET bbox échouent.
-        Moins fiable mais permet de chercher des zones non prédéfinies.
+        Les requêtes partent au rythme autorisé par Nominatim (1 par seconde),
+        sans attendre la réponse des précédentes. Les réponses sont mises en cache
+        et les relations trouvées sont mémorisées: le chargement suivant de ces
+        zones utilise directement la méthode administrative.
+        
+        Args:
+            zone_names: Noms des zones
+            max_workers: Nombre de recherches simultanées
+        
+        Returns:
+            Dict[str, Optional[int]]: Relation OSM trouvée par nom de zone (None sinon)
         """
-        logger.info(f"🔍 DERNIER RECOURS: Recherche Nominatim pour {zone_name}")
+        relations = {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(zone_names)))) as executor:
+            futures = {executor.submit(self._nominatim_search, zone_name): zone_name for zone_name in zone_names}
+            
+            for future in futures:
+                zone_name = futures[future]
+                try:
+                    data = future.result()
+                    zone_info = data[0] if data else {}
+                    relation_id = zone_info.get('osm_id') if zone_info.get('osm_type') == 'relation' else None
+                except Exception as e:
+                    logger.warning(f"⚠️ Préchargement Nominatim échoué pour {zone_name}: {str(e)}")
+                    relation_id = None
+                
+                relations[zone_name] = relation_id
+                
+                if relation_id:
+                    zone_id = zone_name.lower().replace(' ', '_').replace('-', '_')
+                    self._discovered_relations[zone_id] = int(relation_id)
+        
+        logger.info(f"📍 Préchargement Nominatim: {sum(1 for r in relations.values() if r)}/{len(relations)} relations trouvées")
+        return relations
+
+    def _nominatim_search(self, zone_name: str) -> List[Dict]:
+        """
+        Recherche Nominatim d'une zone (réponse décodée, cache disque, 1 requête/s)
+        
+        Seules les réponses valides (HTTP 200, liste de résultats) sont mises en cache.
         
-        # Recherche de la zone via Nominatim
-        nominatim_url = "https://nominatim.openstreetmap.org/search"
+        Raises:
+            Exception: Si Nominatim répond par une erreur ou un format inattendu
+        """
         params = {
             'q': f"{zone_name}, Malaysia",
             'format': 'json',
@@ -386,9 +933,44 @@ out geom;"""
             'addressdetails': 1
         }
         
+        cache_key = _ResponseCache.make_key(NOMINATIM_SEARCH_URL, params['q'])
+        data = self._cache_get(cache_key)
+        
+        if not isinstance(data, list):
+            _NOMINATIM_LIMITER.acquire()  # Politique d'usage Nominatim
+            response = self.session.get(NOMINATIM_SEARCH_URL, params=params, timeout=30)
+            
+            if response.status_code != 200:
+                raise Exception(f"Nominatim: HTTP {response.status_code}")
+            
+            data = _json_loads(response.content)
+            
+            # Une erreur Nominatim peut arriver en 200 sous forme d'objet: jamais mise en cache
+            if not isinstance(data, list):
+                raise Exception(f"Nominatim: réponse inattendue ({type(data).__name__})")
+            
+            if data:
+                self._cache_set(cache_key, data)
+        
+        return data
+
+    def _relation_for_zone(self, zone_id: str) -> Optional[int]:
+        """Relation administrative d'une zone: table connue, puis relations trouvées par préchargement"""
+        zone_key = zone_id.lower()
+        return _ADMIN_RELATIONS.get(zone_key) or self._discovered_relations.get(zone_key)
+
+    def _fallback_to_nominatim_search(self, zone_name: str) -> OSMResult:
+        """
+        🥉 DERNIER RECOURS: Recherche par nom via Nominatim
+        
+        Utilisée seulement si administrative ET bbox échouent.
+        Moins fiable mais permet de chercher des zones non prédéfinies.
+        """
+        logger.info(f"🔍 DERNIER RECOURS: Recherche Nominatim pour {zone_name}")
+        
         try:
-            response = self.session.get(nominatim_url, params=params, timeout=30)
-            data = response.json()
+            # Recherche de la zone via Nominatim (cache / préchargement)
+            data = self._nominatim_search(zone_name)
             
             if not data:
                 raise ValueError(f"Zone '{zone_name}' non trouvée via Nominatim")
@@ -454,117 +1036,258 @@ out geom;"""
 
     def _execute_overpass_query(self, query: str, max_retries: int = 3) -> Dict:
         """
-        Exécute une requête Overpass avec retry intelligent
+        Exécute une requête Overpass sur toutes les APIs en parallèle
+        
+        Chaque miroir est interrogé dans son propre thread (avec ses retries):
+        la première réponse valide est retournée et les autres miroirs arrêtent
+        leurs tentatives et la lecture de leur réponse en cours (connexion fermée,
+        place rendue au limiteur de l'hôte). Un miroir lent ou saturé ne retarde
+        plus les suivants.
         """
+        cache_key = _ResponseCache.make_key(query)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"💾 Réponse Overpass lue dans le cache: {len(cached.get('elements', [])):,} éléments")
+            return cached
+        
         last_error = None
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(OVERPASS_APIS))
         
-        for api_index, api_url in enumerate(OVERPASS_APIS):
-            for attempt in range(max_retries):
-                try:
-                    logger.info(f"🌐 Tentative {attempt + 1}/{max_retries} sur API {api_index + 1}/{len(OVERPASS_APIS)}")
-                    logger.info(f"🔗 URL: {api_url}")
-                    
-                    response = self.session.post(
-                        api_url,
-                        data=query,
-                        timeout=400,  # Timeout généreux pour grandes zones
-                        headers={'Content-Type': 'text/plain; charset=utf-8'}
-                    )
+        try:
+            pending = {
+                executor.submit(self._query_overpass_api, api_index, api_url, query, max_retries, stop_event)
+                for api_index, api_url in enumerate(OVERPASS_APIS)
+            }
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
                     
+                    # Réponse partielle (remark: délai/mémoire dépassé) ou vide: jamais mise en cache
+                    if result.get('elements') and not result.get('remark'):
+                        self._cache_set(cache_key, result)
+                    return result
+        finally:
+            # Arrêt des miroirs encore en cours, sans attendre leur fin
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        raise Exception(f"Toutes les tentatives Overpass ont échoué. Dernière erreur: {last_error}")
+
+    def _cache_get(self, key: str):
+        """Lecture dans le cache disque (None si absent, expiré ou cache indisponible)"""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"⚠️ Lecture cache OSM échouée: {str(e)}")
+            return None
+
+    def _cache_set(self, key: str, value) -> None:
+        """Écriture dans le cache disque (erreurs journalisées, jamais propagées)"""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value)
+        except (sqlite3.Error, TypeError) as e:
+            logger.warning(f"⚠️ Écriture cache OSM échouée: {str(e)}")
+
+    def _query_overpass_api(
+        self,
+        api_index: int,
+        api_url: str,
+        query: str,
+        max_retries: int,
+        stop_event: threading.Event
+    ) -> Dict:
+        """
+        Interroge un miroir Overpass avec retry intelligent (un thread par miroir)
+        
+        Les attentes entre tentatives sont interrompues dès qu'un autre miroir a répondu.
+        """
+        last_error = None
+        limiter, slots = _host_limiter(api_url)
+        
+        for attempt in range(max_retries):
+            if stop_event.is_set():
+                last_error = "Réponse obtenue sur un autre miroir"
+                break
+            
+            try:
+                logger.info(f"🌐 Tentative {attempt + 1}/{max_retries} sur API {api_index + 1}/{len(OVERPASS_APIS)}")
+                logger.info(f"🔗 URL: {api_url}")
+                
+                # Débit limité par hôte, partagé par tous les chargeurs (politique d'usage Overpass)
+                if not limiter.acquire(stop_event):
+                    last_error = "Réponse obtenue sur un autre miroir"
+                    break
+                
+                # Réponse lue en flux: fermée en sortie du bloc quel que soit le statut,
+                # pour rendre la connexion au pool même sans lecture du corps
+                with slots, self.session.post(
+                    api_url,
+                    data=query,
+                    timeout=400,  # Timeout généreux pour grandes zones
+                    headers={'Content-Type': 'text/plain; charset=utf-8'},
+                    stream=True  # Corps lu à la demande (voir _read_overpass_response)
+                ) as response:
                     logger.info(f"📡 Statut HTTP: {response.status_code}")
-                    logger.info(f"📊 Taille réponse: {len(response.content):,} bytes")
+                    logger.info(f"📊 Taille annoncée: {response.headers.get('Content-Length', 'inconnue')} bytes")
                     
                     if response.status_code == 200:
-                        result = response.json()
-                        elements_count = len(result.get('elements', []))
-                        logger.info(f"📋 Éléments dans la réponse: {elements_count:,}")
-                        return result
-                        
-                    elif response.status_code == 429:  # Rate limiting
-                        wait_time = 2 ** attempt * (api_index + 1)  # Backoff progressif
-                        logger.warning(f"⏳ Rate limiting, attente {wait_time}s")
-                        time.sleep(wait_time)
-                        continue
-                        
-                    elif response.status_code == 504:  # Timeout serveur
-                        logger.warning(f"⏱️ Timeout serveur, essai API suivante")
-                        break  # Passer à l'API suivante
-                        
-                    else:
+                        result = self._read_overpass_response(response, stop_event)
+                    elif response.status_code not in (429, 504):
                         error_text = response.text[:200] if response.text else "Pas de détails"
-                        logger.warning(f"❌ HTTP {response.status_code}: {error_text}")
-                        raise requests.HTTPError(f"HTTP {response.status_code}")
-                        
-                except requests.Timeout:
-                    logger.warning(f"⏱️ Timeout réseau sur {api_url}")
-                    last_error = "Timeout réseau"
-                    break  # Passer à l'API suivante
+                
+                if response.status_code == 200:
+                    elements_count = len(result.get('elements', []))
+                    logger.info(f"📋 Éléments dans la réponse: {elements_count:,}")
+                    return result
                     
-                except Exception as e:
-                    last_error = e
-                    logger.warning(f"⚠️ Erreur tentative {attempt + 1}: {str(e)}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        logger.info(f"⏳ Attente {wait_time}s avant retry")
-                        time.sleep(wait_time)
+                elif response.status_code == 429:  # Rate limiting
+                    wait_time = _retry_after_seconds(response)  # Délai imposé par le serveur
+                    if wait_time is None:
+                        wait_time = _backoff_delay(attempt)
+                    logger.warning(f"⏳ Rate limiting, attente {wait_time:.1f}s")
+                    last_error = "Rate limiting (HTTP 429)"
+                    stop_event.wait(wait_time)
+                    continue
+                    
+                elif response.status_code == 504:  # Timeout serveur
+                    logger.warning(f"⏱️ Timeout serveur sur {api_url}")
+                    last_error = "Timeout serveur (HTTP 504)"
+                    break  # Abandon de ce miroir
+                    
+                else:
+                    logger.warning(f"❌ HTTP {response.status_code}: {error_text}")
+                    raise requests.HTTPError(f"HTTP {response.status_code}")
+                    
+            except requests.Timeout:
+                logger.warning(f"⏱️ Timeout réseau sur {api_url}")
+                last_error = "Timeout réseau"
+                break  # Abandon de ce miroir
+                
+            except InterruptedError as e:
+                last_error = str(e)
+                break  # Un autre miroir a répondu: réponse en cours abandonnée
+                
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ Erreur tentative {attempt + 1}: {str(e)}")
+                if attempt < max_retries - 1:
+                    wait_time = _backoff_delay(attempt)
+                    logger.info(f"⏳ Attente {wait_time:.1f}s avant retry")
+                    stop_event.wait(wait_time)
         
-        raise Exception(f"Toutes les tentatives Overpass ont échoué. Dernière erreur: {last_error}")
+        raise Exception(f"API {api_url}: {last_error}")
+
+    def _read_overpass_response(self, response: requests.Response, stop_event: threading.Event) -> Dict:
+        """
+        Décode le corps d'une réponse Overpass
+        
+        Avec ijson, le document est décodé clé par clé depuis le flux HTTP: la réponse
+        brute (jusqu'à plusieurs centaines de Mo) n'est jamais chargée entière en
+        mémoire à côté des éléments décodés. Toutes les clés de premier niveau sont
+        conservées, dont 'remark' (timeout ou erreur d'exécution côté Overpass).
+        
+        Raises:
+            InterruptedError: si un autre miroir a répondu pendant la lecture
+        """
+        reader = _StoppableReader(response, stop_event)  # Décompression gzip à la volée
+        if not IJSON_AVAILABLE:
+            return _json_loads(reader.read())
+        
+        return dict(ijson.kvitems(reader, '', use_float=True))
 
     def _process_osm_elements(self, elements: List[Dict], zone_name: str) -> List[Dict]:
         """
         Traite les éléments OSM et les convertit en bâtiments
+        
+        Première passe: filtrage des ways bâtiments et collecte des coordonnées à plat.
+        Centres, surfaces et filtre Malaysia sont ensuite calculés en NumPy pour tous
+        les bâtiments à la fois; les dictionnaires ne sont créés que pour les retenus.
         """
-        buildings = []
-        processed_count = 0
-        skipped_count = 0
+        candidates = []
+        all_lats = []
+        all_lons = []
+        offsets = []
         
         logger.info(f"🔄 Traitement de {len(elements):,} éléments OSM")
         
-        for element in elements:
-            processed_count += 1
-            
+        for processed_count, element in enumerate(elements, 1):
             # Affichage du progrès pour grandes collections
             if processed_count % 50000 == 0:
                 logger.info(f"🔄 Progrès: {processed_count:,}/{len(elements):,} éléments traités")
             
+            # Chemin nominal sans .get(): clé absente (pas un bâtiment, pas de géométrie) → KeyError
             try:
                 # Vérifier le type d'élément
-                if element.get('type') != 'way':
-                    skipped_count += 1
+                if element['type'] != 'way':
                     continue
                 
-                tags = element.get('tags', {})
-                building_tag = tags.get('building')
-                
                 # Vérifier que c'est bien un bâtiment
-                if not building_tag or building_tag in ['no', 'false']:
-                    skipped_count += 1
+                building_tag = element['tags']['building']
+                if building_tag in _REJECTED_BUILDING_TAGS:
                     continue
                 
                 # Vérifier la géométrie
-                geometry = element.get('geometry', [])
+                geometry = element['geometry']
                 if len(geometry) < 3:  # Besoin d'au moins 3 points pour un polygone
-                    skipped_count += 1
-                    continue
-                
-                # Calculer le centre géométrique
-                lats = [coord['lat'] for coord in geometry if 'lat' in coord]
-                lons = [coord['lon'] for coord in geometry if 'lon' in coord]
-                
-                if not lats or not lons or len(lats) < 3:
-                    skipped_count += 1
                     continue
                 
-                center_lat = sum(lats) / len(lats)
-                center_lon = sum(lons) / len(lons)
-                
-                # Vérifier que les coordonnées sont dans Malaysia
-                if not (0.5 <= center_lat <= 7.5 and 99.0 <= center_lon <= 120.0):
-                    skipped_count += 1
-                    continue
+                # Coordonnées ajoutées à plat; un noeud incomplet est seul ignoré,
+                # le bâtiment restant retenu s'il garde au moins 3 noeuds
+                try:
+                    lats = list(map(_get_lat, geometry))
+                    lons = list(map(_get_lon, geometry))
+                except KeyError:
+                    geometry = [node for node in geometry if 'lat' in node and 'lon' in node]
+                    if len(geometry) < 3:
+                        continue
+                    lats = list(map(_get_lat, geometry))
+                    lons = list(map(_get_lon, geometry))
                 
-                # Calculer la surface approximative
-                surface_area = self._calculate_building_area(lats, lons)
+            except (KeyError, TypeError):
+                continue
+            
+            offsets.append(len(all_lats))
+            all_lats.extend(lats)
+            all_lons.extend(lons)
+            candidates.append((element.get('id', processed_count), building_tag, element['tags']))
+        
+        # Éléments écartés par le filtrage (comptés une fois, pas à chaque rejet)
+        skipped_count = len(elements) - len(candidates)
+        
+        buildings = []
+        
+        if candidates:
+            center_lats, center_lons, surface_areas = _geometry_metrics(
+                np.array(all_lats, dtype=np.float64),
+                np.array(all_lons, dtype=np.float64),
+                np.array(offsets, dtype=np.int64)
+            )
+            
+            # Vérifier que les coordonnées sont dans Malaysia
+            in_malaysia = (
+                (center_lats >= 0.5) & (center_lats <= 7.5) &
+                (center_lons >= 99.0) & (center_lons <= 120.0)
+            )
+            skipped_count += int((~in_malaysia).sum())
+            
+            kept = np.flatnonzero(in_malaysia)
+            
+            for index, center_lat, center_lon, surface_area in zip(
+                kept.tolist(), center_lats[kept].tolist(), center_lons[kept].tolist(), surface_areas[kept].tolist()
+            ):
+                osm_id, building_tag, tags = candidates[index]
                 
                 # Déterminer le type de bâtiment
                 building_type = self._determine_building_type(building_tag, tags)
@@ -574,7 +1297,7 @@ out geom;"""
                 
                 # Créer l'objet bâtiment
                 building = {
-                    'id': f"OSM{element.get('id', processed_count)}",
+                    'id': f"OSM{osm_id}",
                     'latitude': round(center_lat, 6),
                     'longitude': round(center_lon, 6),
                     'building_type': building_type,
@@ -589,10 +1312,6 @@ out geom;"""
                 # Affichage des premiers bâtiments pour debug
                 if len(buildings) <= 5:
                     logger.info(f"🏗️ Bâtiment {len(buildings)}: {building_type} à ({center_lat:.4f}, {center_lon:.4f}) - {surface_area:.0f}m²")
-                
-            except Exception as e:
-                skipped_count += 1
-                continue
         
         logger.info(f"✅ Traitement terminé: {len(buildings):,} bâtiments créés, {skipped_count:,} ignorés")
         
@@ -606,92 +1325,24 @@ out geom;"""
         
         return buildings
 
-    def _calculate_building_area(self, lats: List[float], lons: List[float]) -> float:
-        """Calcule la surface approximative d'un bâtiment"""
-        if len(lats) < 3:
-            return 100.0  # Surface par défaut
-        
-        # Méthode simple : rectangle englobant
-        lat_range = max(lats) - min(lats)
-        lon_range = max(lons) - min(lons)
-        
-        # Conversion degrés → mètres (approximation pour Malaysia ~4°N)
-        meters_per_degree_lat = 111000
-        meters_per_degree_lon = 111000 * math.cos(math.radians(sum(lats) / len(lats)))
-        
-        area_m2 = (lat_range * meters_per_degree_lat) * (lon_range * meters_per_degree_lon)
-        
-        # Borner la surface entre des valeurs réalistes
-        return max(20, min(10000, area_m2))
-
     def _determine_building_type(self, building_tag: str, tags: Dict) -> str:
-        """Détermine le type de bâtiment selon les tags OSM"""
-        
-        # Mapping des tags OSM vers nos catégories
-        type_mapping = {
-            # Résidentiel
-            'residential': 'residential',
-            'house': 'residential', 
-            'detached': 'residential',
-            'terrace': 'residential',
-            'apartment': 'residential',
-            'apartments': 'residential',
-            'dormitory': 'residential',
-            'bungalow': 'residential',
-            
-            # Commercial
-            'commercial': 'commercial',
-            'retail': 'commercial',
-            'shop': 'commercial',
-            'mall': 'commercial',
-            'supermarket': 'commercial',
-            'office': 'commercial',
-            'hotel': 'commercial',
-            'restaurant': 'commercial',
-            
-            # Industriel
-            'industrial': 'industrial',
-            'warehouse': 'industrial',
-            'factory': 'industrial',
-            'manufacture': 'industrial',
-            'storage': 'industrial',
-            
-            # Public/Institutionnel
-            'school': 'public',
-            'hospital': 'public',
-            'university': 'public',
-            'college': 'public',
-            'clinic': 'public',
-            'government': 'public',
-            'civic': 'public',
-            'public': 'public',
-            'religious': 'public',
-            'mosque': 'public',
-            'temple': 'public',
-            'church': 'public',
-        }
+        """Détermine le type de bâtiment selon les tags OSM (tables de correspondance du module)"""
         
         # Vérifier d'abord le tag building
-        main_type = type_mapping.get(building_tag.lower(), None)
+        main_type = _BUILDING_TYPE_MAP.get(building_tag.lower())
         if main_type:
             return main_type
         
         # Vérifier les autres tags utiles
-        if 'amenity' in tags:
-            amenity = tags['amenity'].lower()
-            if amenity in ['school', 'hospital', 'clinic', 'university']:
-                return 'public'
-            elif amenity in ['restaurant', 'cafe', 'bank', 'shop']:
-                return 'commercial'
+        amenity = tags.get('amenity')
+        if amenity:
+            amenity_type = _AMENITY_TYPE_MAP.get(amenity.lower())
+            if amenity_type:
+                return amenity_type
         
-        if 'shop' in tags:
-            return 'commercial'
-            
-        if 'office' in tags:
-            return 'commercial'
-            
-        if 'industrial' in tags:
-            return 'industrial'
+        for tag, tag_type in _TAG_PRESENCE_TYPES:
+            if tag in tags:
+                return tag_type
         
         # Par défaut : résidentiel (le plus commun en Malaysia)
         return 'residential'
@@ -9,13 +9,14 @@ Ce package contient les structures de données principales:
 """
 
 from .building import Building, create_building_from_coordinates, validate_building_list
-from .timeseries import TimeSeries, timeseries_to_dataframe, validate_timeseries_data
+from .timeseries import TimeSeries, iter_timeseries, timeseries_to_dataframe, validate_timeseries_data
 
 __all__ = [
     'Building',
     'create_building_from_coordinates',
     'validate_building_list',
     'TimeSeries',
+    'iter_timeseries',
     'timeseries_to_dataframe',
     'validate_timeseries_data'
 ]
\ No newline at end of file
@@ -10,8 +10,64 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from collections import Counter
+import functools
 import math
 
+import numpy as np
+
+
+# Correspondance des types OSM vers les catégories supportées
+_TYPE_MAPPING = {
+    'residential': 'residential',
+    'house': 'residential',
+    'apartment': 'residential',
+    'apartments': 'residential',
+    'detached': 'residential',
+    'terrace': 'residential',
+    'commercial': 'commercial',
+    'retail': 'commercial',
+    'shop': 'commercial',
+    'office': 'office',
+    'industrial': 'industrial',
+    'factory': 'industrial',
+    'warehouse': 'industrial',
+    'hospital': 'hospital',
+    'school': 'school',
+    'university': 'school',
+    'hotel': 'hotel',
+    'yes': 'residential',
+    'true': 'residential'
+}
+
+# Coefficients de consommation par type (kWh/m²/jour) pour Malaysia
+_CONSUMPTION_COEFFICIENTS = {
+    'residential': 0.15,
+    'commercial': 0.25,
+    'office': 0.30,
+    'industrial': 0.45,
+    'hospital': 0.40,
+    'school': 0.20,
+    'hotel': 0.35
+}
+
+# Dépendance climatique par type
+_CLIMATE_DEPENDENCY = {
+    'residential': 'élevée',
+    'commercial': 'très_élevée',
+    'office': 'très_élevée',
+    'industrial': 'moyenne',
+    'hospital': 'critique',
+    'school': 'élevée',
+    'hotel': 'très_élevée'
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _map_building_type(building_type: str) -> str:
+    """Catégorie supportée d'un type OSM brut (peu de valeurs distinctes, résultat mis en cache)"""
+    return _TYPE_MAPPING.get(building_type.lower(), 'residential')
+
 
 @dataclass
 class Building:
@@ -71,29 +127,7 @@ class Building:
     
     def _normalize_building_type(self, building_type: str) -> str:
         """Normalise le type de bâtiment vers les catégories supportées"""
-        type_mapping = {
-            'residential': 'residential',
-            'house': 'residential',
-            'apartment': 'residential',
-            'apartments': 'residential',
-            'detached': 'residential',
-            'terrace': 'residential',
-            'commercial': 'commercial',
-            'retail': 'commercial',
-            'shop': 'commercial',
-            'office': 'office',
-            'industrial': 'industrial',
-            'factory': 'industrial',
-            'warehouse': 'industrial',
-            'hospital': 'hospital',
-            'school': 'school',
-            'university': 'school',
-            'hotel': 'hotel',
-            'yes': 'residential',
-            'true': 'residential'
-        }
-        
-        normalized = type_mapping.get(building_type.lower(), 'residential')
+        normalized = _map_building_type(building_type)
         
         # Affinage avec les tags OSM si disponibles
         if self.osm_tags:
@@ -114,18 +148,7 @@ class Building:
     
     def _calculate_base_consumption(self) -> float:
         """Calcule la consommation de base selon le type et la surface"""
-        # Coefficients de consommation par type (kWh/m²/jour) pour Malaysia
-        consumption_coefficients = {
-            'residential': 0.15,
-            'commercial': 0.25,
-            'office': 0.30,
-            'industrial': 0.45,
-            'hospital': 0.40,
-            'school': 0.20,
-            'hotel': 0.35
-        }
-        
-        coefficient = consumption_coefficients.get(self.building_type, 0.15)
+        coefficient = _CONSUMPTION_COEFFICIENTS.get(self.building_type, 0.15)
         base_consumption = self.surface_area_m2 * coefficient
         
         # Limites de validation
@@ -185,25 +208,19 @@ class Building:
             return 50.0  # Surface par défaut
         
         try:
-            # Conversion en coordonnées métriques approximatives
-            coords_m = []
-            for coord in geometry:
-                lat = coord.get('lat', 0)
-                lon = coord.get('lon', 0)
-                
-                # Conversion approximative à la latitude de Malaysia
-                x = lon * 111320 * math.cos(math.radians(lat))
-                y = lat * 110540
-                coords_m.append((x, y))
+            # Conversion en coordonnées métriques approximatives, sur tous les sommets à la fois
+            lats = np.fromiter((coord.get('lat', 0) for coord in geometry), dtype=np.float64, count=len(geometry))
+            lons = np.fromiter((coord.get('lon', 0) for coord in geometry), dtype=np.float64, count=len(geometry))
             
-            # Formule de Shoelace
-            n = len(coords_m)
-            area = 0.0
+            # Conversion approximative à la latitude de Malaysia
+            x = lons * 111320 * np.cos(np.radians(lats))
+            y = lats * 110540
             
-            for i in range(n):
-                j = (i + 1) % n
-                area += coords_m[i][0] * coords_m[j][1]
-                area -= coords_m[j][0] * coords_m[i][1]
+            # Formule de Shoelace: somme des produits croisés avec le sommet suivant
+            # (coordonnées centrées: même aire, sans annulation entre grands produits)
+            x -= x.mean()
+            y -= y.mean()
+            area = float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
             
             area = abs(area) / 2.0
             
@@ -286,17 +303,7 @@ class Building:
     
     def _get_climate_dependency(self) -> str:
         """Évalue la dépendance climatique"""
-        climate_dependency = {
-            'residential': 'élevée',
-            'commercial': 'très_élevée',
-            'office': 'très_élevée',
-            'industrial': 'moyenne',
-            'hospital': 'critique',
-            'school': 'élevée',
-            'hotel': 'très_élevée'
-        }
-        
-        return climate_dependency.get(self.building_type, 'moyenne')
+        return _CLIMATE_DEPENDENCY.get(self.building_type, 'moyenne')
     
     def distance_to(self, other: 'Building') -> float:
         """Calcule la distance vers un autre bâtiment en km"""
@@ -483,60 +490,66 @@ def calculate_buildings_statistics(buildings: List[Building]) -> Dict:
     if not buildings:
         return {'error': 'Aucun bâtiment fourni'}
     
-    # Groupement par type
-    type_groups = group_buildings_by_type(buildings)
+    total = len(buildings)
     
-    # Calculs statistiques
-    surfaces = [b.surface_area_m2 for b in buildings]
-    consumptions = [b.base_consumption_kwh for b in buildings]
+    # Comptage par type (une passe, ordre de première apparition conservé)
+    type_counts = Counter(b.building_type for b in buildings)
+    
+    # Attributs extraits une seule fois en tableaux NumPy
+    surfaces = np.fromiter((b.surface_area_m2 for b in buildings), dtype=np.float64, count=total)
+    consumptions = np.fromiter((b.base_consumption_kwh for b in buildings), dtype=np.float64, count=total)
     
     # Coordonnées pour bounding box
-    lats = [b.latitude for b in buildings]
-    lons = [b.longitude for b in buildings]
+    lats = np.fromiter((b.latitude for b in buildings), dtype=np.float64, count=total)
+    lons = np.fromiter((b.longitude for b in buildings), dtype=np.float64, count=total)
+    
+    # Médiane haute (élément n//2 du tri) obtenue par sélection partielle
+    middle = total // 2
+    surface_total = float(surfaces.sum())
+    consumption_total = float(consumptions.sum())
+    with_osm_tags = sum(1 for b in buildings if b.osm_tags)
     
     statistics = {
-        'total_buildings': len(buildings),
+        'total_buildings': total,
         'building_types': {
-            'distribution': {t: len(bldgs) for t, bldgs in type_groups.items()},
+            'distribution': dict(type_counts),
             'percentages': {
-                t: round(len(bldgs) / len(buildings) * 100, 1) 
-                for t, bldgs in type_groups.items()
+                t: round(count / total * 100, 1) 
+                for t, count in type_counts.items()
             }
         },
         'surface_statistics': {
-            'total_m2': round(sum(surfaces), 1),
-            'mean_m2': round(sum(surfaces) / len(surfaces), 1),
-            'median_m2': round(sorted(surfaces)[len(surfaces)//2], 1),
-            'min_m2': min(surfaces),
-            'max_m2': max(surfaces)
+            'total_m2': round(surface_total, 1),
+            'mean_m2': round(surface_total / total, 1),
+            'median_m2': round(float(np.partition(surfaces, middle)[middle]), 1),
+            'min_m2': float(surfaces.min()),
+            'max_m2': float(surfaces.max())
         },
         'consumption_statistics': {
-            'total_kwh_per_day': round(sum(consumptions), 1),
-            'mean_kwh_per_day': round(sum(consumptions) / len(consumptions), 1),
-            'median_kwh_per_day': round(sorted(consumptions)[len(consumptions)//2], 1),
-            'min_kwh_per_day': min(consumptions),
-            'max_kwh_per_day': max(consumptions),
-            'estimated_annual_mwh': round(sum(consumptions) * 365 / 1000, 1)
+            'total_kwh_per_day': round(consumption_total, 1),
+            'mean_kwh_per_day': round(consumption_total / total, 1),
+            'median_kwh_per_day': round(float(np.partition(consumptions, middle)[middle]), 1),
+            'min_kwh_per_day': float(consumptions.min()),
+            'max_kwh_per_day': float(consumptions.max()),
+            'estimated_annual_mwh': round(consumption_total * 365 / 1000, 1)
         },
         'geographic_extent': {
             'bounding_box': {
-                'north': max(lats),
-                'south': min(lats),
-                'east': max(lons),
-                'west': min(lons)
+                'north': float(lats.max()),
+                'south': float(lats.min()),
+                'east': float(lons.max()),
+                'west': float(lons.min())
             },
             'center': {
-                'latitude': round(sum(lats) / len(lats), 6),
-                'longitude': round(sum(lons) / len(lons), 6)
+                'latitude': round(float(lats.mean()), 6),
+                'longitude': round(float(lons.mean()), 6)
             }
         },
         'quality_metrics': {
             'unique_ids': len(set(b.building_id for b in buildings)),
             'unique_osm_ids': len(set(b.osm_id for b in buildings if b.osm_id)),
-            'has_osm_tags': len([b for b in buildings if b.osm_tags]),
-            'completeness_score': round(
-                (len([b for b in buildings if b.osm_tags]) / len(buildings)) * 100, 1
-            )
+            'has_osm_tags': with_osm_tags,
+            'completeness_score': round((with_osm_tags / total) * 100, 1)
         }
     }
     
@@ -8,10 +8,47 @@ de consommation électrique avec métadonnées climatiques et contextuelles.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from operator import attrgetter
+from typing import Dict, Iterator, Optional
+import warnings
 import pandas as pd
 
 
+# Colonnes produites par TimeSeries.to_pandas_row (même ordre)
+_PANDAS_ROW_FIELDS = (
+    'building_id', 'timestamp', 'consumption_kwh', 'temperature_c', 'humidity',
+    'heat_index', 'building_type', 'zone_name', 'is_business_hour',
+    'data_quality_score', 'anomaly_flag'
+)
+
+# Arguments du constructeur TimeSeries et valeurs par défaut (mêmes que from_dict)
+_TIMESERIES_INIT_DEFAULTS = {
+    'building_id': '',
+    'consumption_kwh': 0.0,
+    'temperature_c': 28.0,
+    'humidity': 0.8,
+    'heat_index': 30.0,
+    'building_type': 'residential',
+    'zone_name': None
+}
+
+# Heures de pic par type de bâtiment
+_PEAK_HOURS = {
+    'residential': [7, 8, 18, 19, 20, 21],
+    'commercial': [10, 11, 12, 13, 14, 15, 16],
+    'office': [9, 10, 11, 14, 15, 16],
+    'industrial': [8, 9, 10, 11, 12, 13, 14, 15],
+    'hospital': list(range(24)),  # Toujours actif
+    'school': [8, 9, 10, 11, 12, 13, 14, 15]
+}
+
+# Mêmes heures en masques booléens de 24 valeurs indexés par l'heure
+_PEAK_HOUR_MASKS = {
+    building_type: tuple(hour in hours for hour in range(24))
+    for building_type, hours in _PEAK_HOURS.items()
+}
+
+
 @dataclass
 class TimeSeries:
     """
@@ -134,6 +171,9 @@ class TimeSeries:
         """
         Convertit en format optimisé pour pandas DataFrame
         
+        Les flags hour/day_of_week/month/is_weekend ne sont pas repris: ils se
+        déduisent du timestamp (df.index.hour, ...) sans occuper une colonne par ligne.
+        
         Returns:
             Dict: Données optimisées pour DataFrame
         """
@@ -146,10 +186,6 @@ class TimeSeries:
             'heat_index': self.heat_index,
             'building_type': self.building_type,
             'zone_name': self.zone_name,
-            'hour': self.hour,
-            'day_of_week': self.day_of_week,
-            'month': self.month,
-            'is_weekend': self.is_weekend,
             'is_business_hour': self.is_business_hour,
             'data_quality_score': self.data_quality_score,
             'anomaly_flag': self.anomaly_flag
@@ -205,18 +241,9 @@ class TimeSeries:
         if self.hour is None:
             return False
         
-        # Heures de pic par type de bâtiment
-        peak_hours = {
-            'residential': [7, 8, 18, 19, 20, 21],
-            'commercial': [10, 11, 12, 13, 14, 15, 16],
-            'office': [9, 10, 11, 14, 15, 16],
-            'industrial': [8, 9, 10, 11, 12, 13, 14, 15],
-            'hospital': list(range(24)),  # Toujours actif
-            'school': [8, 9, 10, 11, 12, 13, 14, 15]
-        }
-        
-        building_peaks = peak_hours.get(self.building_type, [])
-        return self.hour in building_peaks
+        # Masque des heures de pic du type (calculé une fois à l'import)
+        peak_mask = _PEAK_HOUR_MASKS.get(self.building_type)
+        return peak_mask is not None and peak_mask[self.hour]
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'TimeSeries':
@@ -273,28 +300,46 @@ def create_timeseries_from_lists(
     if not (len(building_ids) == len(timestamps) == len(consumptions)):
         raise ValueError("Les listes doivent avoir la même longueur")
     
-    timeseries_list = []
+    n = len(building_ids)
+    
+    # Timestamps convertis en un seul appel vectorisé, colonnes par défaut
+    # construites une fois pour toute la liste au lieu d'une fois par point
+    # Fuseaux horaires mélangés (ou naïfs et localisés): pas d'index commun possible
+    # (erreur, ou index d'objets datetime selon la version de pandas), conversion
+    # point par point comme auparavant
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            parsed_timestamps = pd.to_datetime(list(timestamps), format='mixed')
+    except (TypeError, ValueError):
+        parsed_timestamps = None
+    if not isinstance(parsed_timestamps, pd.DatetimeIndex):
+        parsed_timestamps = [pd.to_datetime(timestamp) for timestamp in timestamps]
+    temperatures = kwargs.get('temperatures', [28] * n)
+    humidities = kwargs.get('humidities', [0.8] * n)
+    heat_indices = kwargs.get('heat_indices', [30] * n)
+    building_types = kwargs.get('building_types', ['residential'] * n)
+    zone_names = kwargs.get('zone_names', [None] * n)
+    
+    # zip tronquerait silencieusement sur une liste optionnelle trop courte
+    if any(len(values) != n for values in (temperatures, humidities, heat_indices, building_types, zone_names)):
+        raise ValueError("Les listes doivent avoir la même longueur")
     
-    for i in range(len(building_ids)):
-        # Récupération des valeurs par défaut
-        temperature = kwargs.get('temperatures', [28] * len(building_ids))[i]
-        humidity = kwargs.get('humidities', [0.8] * len(building_ids))[i]
-        heat_index = kwargs.get('heat_indices', [30] * len(building_ids))[i]
-        building_type = kwargs.get('building_types', ['residential'] * len(building_ids))[i]
-        zone_name = kwargs.get('zone_names', [None] * len(building_ids))[i]
-        
-        ts = TimeSeries(
-            building_id=building_ids[i],
-            timestamp=pd.to_datetime(timestamps[i]),
-            consumption_kwh=consumptions[i],
+    timeseries_list = [
+        TimeSeries(
+            building_id=building_id,
+            timestamp=timestamp,
+            consumption_kwh=consumption,
             temperature_c=temperature,
             humidity=humidity,
             heat_index=heat_index,
             building_type=building_type,
             zone_name=zone_name
         )
-        
-        timeseries_list.append(ts)
+        for building_id, timestamp, consumption, temperature, humidity, heat_index, building_type, zone_name
+        in zip(building_ids, parsed_timestamps, consumptions, temperatures,
+               humidities, heat_indices, building_types, zone_names)
+    ]
     
     return timeseries_list
 
@@ -312,11 +357,12 @@ def timeseries_to_dataframe(timeseries_list: list) -> pd.DataFrame:
     if not timeseries_list:
         return pd.DataFrame()
     
-    # Conversion en dictionnaires
-    data_rows = [ts.to_pandas_row() for ts in timeseries_list]
-    
-    # Création du DataFrame
-    df = pd.DataFrame(data_rows)
+    # Création du DataFrame colonne par colonne (mêmes champs que to_pandas_row),
+    # sans dictionnaire intermédiaire par point
+    df = pd.DataFrame({
+        field: list(map(attrgetter(field), timeseries_list))
+        for field in _PANDAS_ROW_FIELDS
+    })
     
     # Optimisation des types de données
     df['building_id'] = df['building_id'].astype('category')
@@ -325,18 +371,17 @@ def timeseries_to_dataframe(timeseries_list: list) -> pd.DataFrame:
     if 'zone_name' in df.columns:
         df['zone_name'] = df['zone_name'].astype('category')
     
+    # Optimisation des flottants: float32 (7 chiffres significatifs) suffit pour
+    # des kWh et grandeurs climatiques simulés, moitié moins de mémoire
+    float_cols = ['consumption_kwh', 'temperature_c', 'humidity', 'heat_index']
+    df[float_cols] = df[float_cols].astype('float32')
+    
     # Optimisation des booléens
-    bool_cols = ['is_weekend', 'is_business_hour', 'anomaly_flag']
+    bool_cols = ['is_business_hour', 'anomaly_flag']
     for col in bool_cols:
         if col in df.columns:
             df[col] = df[col].astype('bool')
     
-    # Optimisation des entiers
-    int_cols = ['hour', 'day_of_week', 'month']
-    for col in int_cols:
-        if col in df.columns:
-            df[col] = df[col].astype('int8')
-    
     # Index sur timestamp pour optimiser les requêtes temporelles
     if 'timestamp' in df.columns:
         df.set_index('timestamp', inplace=True)
@@ -345,6 +390,39 @@ def timeseries_to_dataframe(timeseries_list: list) -> pd.DataFrame:
     return df
 
 
+def iter_timeseries(df: pd.DataFrame) -> Iterator[TimeSeries]:
+    """
+    Parcourt un DataFrame de consommation en créant les TimeSeries à la demande
+    
+    Les objets sont instanciés un par un pendant l'itération: le générateur
+    produit directement le DataFrame et seuls les consommateurs qui ont besoin
+    de l'API TimeSeries paient le coût de création.
+    
+    Args:
+        df: DataFrame de séries temporelles (timestamp en colonne ou en index)
+        
+    Returns:
+        Iterator[TimeSeries]: Points temporels, dans l'ordre des lignes
+    """
+    if df is None or df.empty:
+        return
+    
+    if 'timestamp' not in df.columns:
+        if df.index.name != 'timestamp':
+            raise ValueError("Colonne 'timestamp' manquante")
+        df = df.reset_index()
+    
+    # Colonnes présentes lues ligne à ligne, colonnes absentes remplacées par les défauts
+    fields = ['timestamp'] + [field for field in _TIMESERIES_INIT_DEFAULTS if field in df.columns]
+    defaults = {
+        field: value for field, value in _TIMESERIES_INIT_DEFAULTS.items()
+        if field not in df.columns
+    }
+    
+    for values in df[fields].itertuples(index=False, name=None):
+        yield TimeSeries(**defaults, **dict(zip(fields, values)))
+
+
 def validate_timeseries_data(timeseries_list: list) -> tuple:
     """
     Valide une liste de données TimeSeries
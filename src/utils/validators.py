@@ -713,13 +713,19 @@ def validate_data_consistency(buildings: List[Dict], timeseries: List[Dict]) ->
         issues.append(f"{len(orphan_timeseries)} séries temporelles sans bâtiment associé")
     
     # Validation des types cohérents
+    # index id → bâtiment construit une seule fois (premier bâtiment de chaque id, comme
+    # la recherche linéaire) au lieu d'un parcours de tous les bâtiments par point
+    buildings_by_id = {}
+    for b in buildings:
+        buildings_by_id.setdefault(b.get('building_id'), b)
+    
     type_mismatches = 0
     for ts in timeseries:
         ts_id = ts.get('building_id')
         ts_type = ts.get('building_type')
         
         # Trouver le bâtiment correspondant
-        building = next((b for b in buildings if b.get('building_id') == ts_id), None)
+        building = buildings_by_id.get(ts_id)
         if building and building.get('building_type') != ts_type:
             type_mismatches += 1
     
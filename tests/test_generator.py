@@ -0,0 +1,56 @@
+"""
+Tests du générateur de consommation électrique (src/core/generator.py)
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# module chargé directement: src/core/__init__.py importe aussi le gestionnaire OSM
+_spec = importlib.util.spec_from_file_location('generator', os.path.join(ROOT_DIR, 'src', 'core', 'generator.py'))
+generator = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generator)
+
+
+BUILDINGS = [
+    {
+        'id': f'b{i}',
+        'building_type': 'residential' if i % 2 else 'commercial',
+        'surface_area_m2': 120.0,
+        'latitude': 3.14,
+        'longitude': 101.69,
+        'zone_name': 'Kuala Lumpur'
+    }
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize('frequency, periods, interval_hours', [
+    ('W', 21, 7 * 24),
+    ('MS', 6, 31 * 24),
+])
+def test_calendar_frequencies(frequency, periods, interval_hours):
+    """Les fréquences calendaires (non fixes) restent acceptées"""
+    _, _, _, _, interval = generator._time_features('2024-01-01', '2024-06-01', frequency)
+    assert interval == interval_hours
+    
+    result = generator.ElectricityDataGenerator(seed=42).generate_timeseries_data(
+        BUILDINGS, '2024-01-01', '2024-06-01', frequency
+    )
+    assert result['success'], result.get('error')
+    assert len(result['data']) == periods * len(BUILDINGS)
+
+
+@pytest.mark.skipif(not generator.NUMBA_AVAILABLE, reason="numba non installé")
+def test_numba_thread_count_restored():
+    """Le nombre de threads numba du thread appelant est rétabli après génération"""
+    previous = generator.get_num_threads()
+    generator.ElectricityDataGenerator(seed=42).generate_timeseries_data(
+        BUILDINGS, '2024-01-01', '2024-01-02', '1H', n_jobs=1
+    )
+    assert generator.get_num_threads() == previous
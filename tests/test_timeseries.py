@@ -0,0 +1,36 @@
+"""
+Tests des utilitaires de séries temporelles (src/models/timeseries.py)
+"""
+
+import importlib.util
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# module chargé directement: src/__init__.py importe aussi le gestionnaire OSM
+_spec = importlib.util.spec_from_file_location('timeseries', os.path.join(ROOT_DIR, 'src', 'models', 'timeseries.py'))
+timeseries = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(timeseries)
+
+
+def test_mixed_timezones():
+    """Des horodatages de fuseaux différents restent acceptés, point par point"""
+    timestamps = ['2024-01-01T08:00:00+08:00', '2024-01-01T00:00:00+00:00']
+    
+    series = timeseries.create_timeseries_from_lists(['b1', 'b2'], timestamps, [1.0, 2.0])
+    
+    assert [ts.timestamp for ts in series] == [pd.Timestamp(t) for t in timestamps]
+    assert series[0].hour == 8
+
+
+def test_short_optional_list():
+    """Une liste optionnelle plus courte que les identifiants est refusée"""
+    with pytest.raises(ValueError):
+        timeseries.create_timeseries_from_lists(
+            ['b1', 'b2', 'b3'], ['2024-01-01'] * 3, [1.0] * 3, temperatures=[30, 31]
+        )